@@ -4,29 +4,18 @@ from __future__ import annotations
 import logging
 from collections import Counter
 from datetime import datetime, timezone
-from typing import Iterable, Optional
+from functools import lru_cache
+from heapq import nlargest
+from operator import itemgetter
+from typing import Callable, List, Optional, Sequence, Tuple
 
 from ..config import Settings
-from ..schemas import Review, ReviewFilters, ReviewSummary, SentimentSplit
+from ..schemas import Review, ReviewCompact, ReviewFilters, ReviewSummary, SentimentSplit
 
 logger = logging.getLogger(__name__)
 
-
-def _bucket_sentiment(star_rating: Optional[int]) -> str:
-    if star_rating is None:
-        return "neutral"
-    if star_rating >= 4:
-        return "positive"
-    if star_rating <= 2:
-        return "negative"
-    return "neutral"
-
-
-def _extract_keywords(text: Optional[str]) -> Iterable[str]:
-    if not text:
-        return []
-    sanitized = "".join(ch.lower() if ch.isalnum() or ch.isspace() else " " for ch in text)
-    stop_words = {
+_STOP_WORDS = frozenset(
+    {
         "the",
         "and",
         "for",
@@ -41,10 +30,66 @@ def _extract_keywords(text: Optional[str]) -> Iterable[str]:
         "not",
         "app",
     }
-    return [token for token in sanitized.split() if len(token) > 3 and token not in stop_words]
+)
+
+
+class _SeparatorTable(dict):
+    """``str.translate`` table mapping every non-alphanumeric, non-space code point to a space.
+
+    Entries are computed on first sight and cached, so curly quotes, dashes, ellipses and
+    emoji are handled like ASCII punctuation while sanitizing stays one C-level pass.
+    """
+
+    def __missing__(self, code_point: int):
+        ch = chr(code_point)
+        mapped = code_point if ch.isalnum() or ch.isspace() else " "
+        self[code_point] = mapped
+        return mapped
+
+
+_PUNCT_TABLE = _SeparatorTable()
+_SENTIMENT_BY_RATING = {
+    None: "neutral",
+    0: "negative",
+    1: "negative",
+    2: "negative",
+    3: "neutral",
+    4: "positive",
+    5: "positive",
+}
+_TOP_KEYWORD_COUNT = 8
+_BY_COUNT = itemgetter(1)
+
+
+def _bucket_sentiment(star_rating: Optional[int]) -> str:
+    bucket = _SENTIMENT_BY_RATING.get(star_rating)
+    if bucket is not None:
+        return bucket
+    # Out-of-range ratings keep the original threshold semantics.
+    return "positive" if star_rating >= 4 else "negative"
+
+
+# Review texts repeat across list calls (cached pages, re-fetches), so tokenized
+# results are memoized; tuples keep the shared cache entries immutable.
+@lru_cache(maxsize=1024)
+def _extract_keywords(text: Optional[str]) -> Tuple[str, ...]:
+    if not text:
+        return ()
+    sanitized = text.lower().translate(_PUNCT_TABLE)
+    return tuple(
+        token for token in sanitized.split() if len(token) > 3 and token not in _STOP_WORDS
+    )
+
+
+@lru_cache(maxsize=4)
+def _get_openai_client(api_key: str):
+    """Return a process-wide async OpenAI client so connections are reused across requests."""
+    from openai import AsyncOpenAI
 
+    return AsyncOpenAI(api_key=api_key)
 
-def _maybe_ai_brief(reviews: list[Review], settings: Settings) -> Optional[str]:
+
+async def maybe_ai_brief(reviews: Sequence[Review], settings: Settings) -> Optional[str]:
     if not settings.ai_provider:
         return None
 
@@ -61,7 +106,7 @@ def _maybe_ai_brief(reviews: list[Review], settings: Settings) -> Optional[str]:
 
     if settings.ai_provider.lower() == "openai":
         try:
-            from openai import OpenAI
+            import openai  # noqa: F401
         except Exception as exc:  # pragma: no cover - optional dependency
             logger.warning("OpenAI SDK missing: %s", exc)
             return None
@@ -70,13 +115,13 @@ def _maybe_ai_brief(reviews: list[Review], settings: Settings) -> Optional[str]:
             logger.warning("OPENAI_API_KEY not configured; skipping AI brief")
             return None
 
-        client = OpenAI(api_key=settings.openai_api_key)
+        client = _get_openai_client(settings.openai_api_key)
         prompt = (
             "Summarize recurring themes from Google Play reviews. "
             "Highlight biggest blockers and wins in under 120 words."
         )
         try:
-            response = client.responses.create(
+            response = await client.responses.create(
                 model="gpt-4o-mini",
                 input=[
                     {
@@ -99,38 +144,108 @@ def _maybe_ai_brief(reviews: list[Review], settings: Settings) -> Optional[str]:
     return None
 
 
-def summarize_reviews(
-    reviews: list[Review],
-    filters: ReviewFilters,
-    settings: Settings,
-) -> ReviewSummary:
-    total = len(reviews)
-    ratings = [review.latest_user_comment.starRating for review in reviews if review.latest_user_comment and review.latest_user_comment.starRating]
-    average_rating = round(sum(ratings) / len(ratings), 2) if ratings else 0.0
+def _to_epoch(value: Optional[datetime]) -> Optional[float]:
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        # Naive filter dates are UTC (see routes._parse_date).
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
 
-    sentiment_counter = Counter()
+
+def _compile_filter(filters: ReviewFilters) -> Optional[Callable[[ReviewCompact], bool]]:
+    """Build one predicate covering only the active filters, or ``None`` if none are set.
+
+    Filter settings are loop-invariant, so the "is this filter set?" checks happen here
+    once instead of for every review.
+    """
+    checks: List[Callable[[ReviewCompact], bool]] = []
+
+    start_ts = _to_epoch(filters.start_date)
+    if start_ts is not None:
+        checks.append(lambda compact: compact.ts is not None and compact.ts >= start_ts)
+    end_ts = _to_epoch(filters.end_date)
+    if end_ts is not None:
+        checks.append(lambda compact: compact.ts is not None and compact.ts <= end_ts)
+
+    min_rating = filters.min_rating
+    if min_rating:
+        checks.append(
+            lambda compact: bool(compact.star_rating) and compact.star_rating >= min_rating
+        )
+    max_rating = filters.max_rating
+    if max_rating:
+        checks.append(
+            lambda compact: bool(compact.star_rating) and compact.star_rating <= max_rating
+        )
+
+    if not checks:
+        return None
+    if len(checks) == 1:
+        return checks[0]
+
+    active = tuple(checks)
+
+    def matches_all(compact: ReviewCompact) -> bool:
+        # A plain loop short-circuits without allocating a generator per review.
+        for check in active:
+            if not check(compact):
+                return False
+        return True
+
+    return matches_all
+
+
+def _aggregate(
+    reviews: Sequence[Review],
+    filters: ReviewFilters,
+    apply_filters: bool,
+) -> tuple[list[Review], ReviewSummary]:
+    """Walk ``reviews`` once, optionally filtering, while accumulating the summary."""
+    matched: list[Review] = []
+    # Histogram of star ratings; sentiment and average are derived from it after the loop.
+    rating_counter = Counter()
     keyword_counter = Counter()
-    now = datetime.now(timezone.utc)
+    # Running total so consumers needing keyword shares don't re-sum the counter.
+    total_keyword_tokens = 0
+    # Recency is compared in raw epoch seconds to avoid building a datetime per review.
+    now_ts = datetime.now(timezone.utc).timestamp()
+    window_secs = filters.recent_activity_window_hours * 3600
     recent_reviews = 0
+    matches = _compile_filter(filters) if apply_filters else None
+    include_keywords = filters.include_keywords
 
     for review in reviews:
-        user_comment = review.latest_user_comment
-        if not user_comment:
+        # Memoized per review, so cached pages skip the Pydantic lookups on later requests.
+        compact = review.compact
+        if compact is None:
+            if not apply_filters:
+                matched.append(review)
             continue
-        sentiment_bucket = _bucket_sentiment(user_comment.starRating)
-        sentiment_counter[sentiment_bucket] += 1
 
-        keywords = _extract_keywords(user_comment.text)
-        keyword_counter.update(keywords)
+        if matches is not None and not matches(compact):
+            continue
+        matched.append(review)
 
-        last_modified = (
-            user_comment.lastModified.to_datetime() if user_comment.lastModified else None
-        )
-        if last_modified:
-            last_modified = last_modified.replace(tzinfo=timezone.utc)
-            delta_hours = (now - last_modified).total_seconds() / 3600
-            if delta_hours <= filters.recent_activity_window_hours:
-                recent_reviews += 1
+        rating_counter[compact.star_rating] += 1
+
+        if include_keywords:
+            keywords = _extract_keywords(compact.text)
+            keyword_counter.update(keywords)
+            total_keyword_tokens += len(keywords)
+
+        if compact.ts is not None and now_ts - compact.ts <= window_secs:
+            recent_reviews += 1
+
+    rating_sum = 0
+    rating_count = 0
+    sentiment_counter = Counter()
+    for star_rating, count in rating_counter.items():
+        sentiment_counter[_bucket_sentiment(star_rating)] += count
+        if star_rating:
+            rating_sum += star_rating * count
+            rating_count += count
+    average_rating = round(rating_sum / rating_count, 2) if rating_count else 0.0
 
     sentiment = SentimentSplit(
         positive=sentiment_counter.get("positive", 0),
@@ -138,14 +253,30 @@ def summarize_reviews(
         negative=sentiment_counter.get("negative", 0),
     )
 
-    ai_brief = _maybe_ai_brief(reviews, settings)
-
-    return ReviewSummary(
-        total_reviews=total,
+    summary = ReviewSummary(
+        total_reviews=len(matched),
         average_rating=average_rating,
         sentiment=sentiment,
-        top_keywords=[keyword for keyword, _ in keyword_counter.most_common(8)],
+        top_keywords=[
+            keyword
+            for keyword, _ in nlargest(_TOP_KEYWORD_COUNT, keyword_counter.items(), key=_BY_COUNT)
+        ],
         recent_activity_window_hours=filters.recent_activity_window_hours,
         recent_reviews=recent_reviews,
-        ai_brief=ai_brief,
+        total_keyword_tokens=total_keyword_tokens,
     )
+    return matched, summary
+
+
+def summarize_reviews(reviews: Sequence[Review], filters: ReviewFilters) -> ReviewSummary:
+    """Compute the numeric summary; the AI brief is produced by :func:`maybe_ai_brief`."""
+    _, summary = _aggregate(reviews, filters, apply_filters=False)
+    return summary
+
+
+def filter_and_summarize(
+    reviews: Sequence[Review],
+    filters: ReviewFilters,
+) -> tuple[list[Review], ReviewSummary]:
+    """Apply the date/rating ``filters`` and summarize the survivors in a single pass."""
+    return _aggregate(reviews, filters, apply_filters=True)
@@ -2,22 +2,56 @@
 from __future__ import annotations
 
 import logging
+import threading
 from datetime import datetime, timezone
-from typing import Optional
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 
-from ..ai.insights import summarize_reviews
+from ..ai.insights import filter_and_summarize, maybe_ai_brief
 from ..config import Settings, get_settings
-from ..schemas import Review, ReviewFilters, ReviewsResponse
+from ..schemas import Review, ReviewFilters, ReviewSummary, ReviewsResponse
 from ..services.google_play_client import GooglePlayReviewClient
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+_SEP = "=" * 100
+_DASH = "-" * 100
 
-def get_client(settings: Settings = Depends(get_settings)) -> GooglePlayReviewClient:
-    return GooglePlayReviewClient(settings)
+
+_CLIENT_LOCK = threading.Lock()
+
+
+def get_client(
+    request: Request,
+    settings: Settings = Depends(get_settings),
+) -> GooglePlayReviewClient:
+    """Return the app-wide client so its service and result caches outlive a request.
+
+    ``get_settings`` is cached, so in production the same client is reused; a new one is
+    only built if a different settings object is injected (e.g. dependency overrides).
+    """
+    client = getattr(request.app.state, "review_client", None)
+    if client is None or client.settings is not settings:
+        with _CLIENT_LOCK:
+            client = getattr(request.app.state, "review_client", None)
+            if client is None or client.settings is not settings:
+                client = GooglePlayReviewClient(settings)
+                request.app.state.review_client = client
+    return client
+
+
+def _render_reviews_response(
+    filters: ReviewFilters,
+    summary: ReviewSummary,
+    reviews: List[Review],
+) -> bytes:
+    """Validate and serialize the list response; run in the threadpool, it is O(reviews)."""
+    return ReviewsResponse(filters=filters, summary=summary, reviews=reviews).model_dump_json(
+        by_alias=True
+    ).encode()
 
 
 def _parse_date(raw: Optional[str]) -> Optional[datetime]:
@@ -32,36 +66,8 @@ def _parse_date(raw: Optional[str]) -> Optional[datetime]:
         raise HTTPException(status_code=400, detail=f"Invalid date format: {raw}") from exc
 
 
-def _filter_reviews(reviews: list[Review], filters: ReviewFilters) -> list[Review]:
-    filtered: list[Review] = []
-    for review in reviews:
-        user_comment = review.latest_user_comment
-        if not user_comment:
-            continue
-
-        last_modified = (
-            user_comment.lastModified.to_datetime() if user_comment.lastModified else None
-        )
-        if filters.start_date and (not last_modified or last_modified < filters.start_date):
-            continue
-        if filters.end_date and (not last_modified or last_modified > filters.end_date):
-            continue
-
-        if filters.min_rating and (
-            not user_comment.starRating or user_comment.starRating < filters.min_rating
-        ):
-            continue
-        if filters.max_rating and (
-            not user_comment.starRating or user_comment.starRating > filters.max_rating
-        ):
-            continue
-
-        filtered.append(review)
-    return filtered
-
-
 @router.get("/api/reviews", response_model=ReviewsResponse)
-def list_reviews(
+async def list_reviews(
     request: Request,
     package_name: Optional[str] = Query(None, description="Android package name"),
     start_date: Optional[str] = Query(None, description="ISO 8601 start date"),
@@ -71,25 +77,28 @@ def list_reviews(
     translation_language: Optional[str] = Query(None, min_length=2, max_length=5),
     page_size: int = Query(50, ge=1, le=500),
     recent_window_hours: int = Query(72, ge=1, le=720),
+    include_keywords: bool = Query(True, description="Extract top keywords for the summary"),
     client: GooglePlayReviewClient = Depends(get_client),
     settings: Settings = Depends(get_settings),
-) -> ReviewsResponse:
-    logger.info("="*100)
-    logger.info("🌍 INCOMING HTTP REQUEST from Client")
-    logger.info("-"*100)
-    logger.info(f"  Method: {request.method}")
-    logger.info(f"  URL: {request.url}")
-    logger.info(f"  Client: {request.client.host if request.client else 'Unknown'}")
-    logger.info("  Query Parameters:")
-    logger.info(f"    - package_name: {package_name}")
-    logger.info(f"    - start_date: {start_date}")
-    logger.info(f"    - end_date: {end_date}")
-    logger.info(f"    - min_rating: {min_rating}")
-    logger.info(f"    - max_rating: {max_rating}")
-    logger.info(f"    - translation_language: {translation_language}")
-    logger.info(f"    - page_size: {page_size}")
-    logger.info(f"    - recent_window_hours: {recent_window_hours}")
-    logger.info("="*100)
+) -> Response:
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(_SEP)
+        logger.info("🌍 INCOMING HTTP REQUEST from Client")
+        logger.info(_DASH)
+        logger.info("  Method: %s", request.method)
+        logger.info("  URL: %s", request.url)
+        logger.info("  Client: %s", request.client.host if request.client else "Unknown")
+        logger.info("  Query Parameters:")
+        logger.info("    - package_name: %s", package_name)
+        logger.info("    - start_date: %s", start_date)
+        logger.info("    - end_date: %s", end_date)
+        logger.info("    - min_rating: %s", min_rating)
+        logger.info("    - max_rating: %s", max_rating)
+        logger.info("    - translation_language: %s", translation_language)
+        logger.info("    - page_size: %s", page_size)
+        logger.info("    - recent_window_hours: %s", recent_window_hours)
+        logger.info("    - include_keywords: %s", include_keywords)
+        logger.info(_SEP)
     resolved_package = package_name or settings.default_package_name
     if not resolved_package:
         raise HTTPException(status_code=400, detail="package_name is required")
@@ -103,32 +112,45 @@ def list_reviews(
         translation_language=translation_language or settings.default_translation_language,
         page_size=page_size,
         recent_activity_window_hours=recent_window_hours,
+        include_keywords=include_keywords,
     )
 
-    reviews = client.list_reviews(
+    # The Google client and the summary pass are blocking; keep them off the event loop.
+    reviews = await run_in_threadpool(
+        client.list_reviews,
         package_name=filters.package_name,
         page_size=filters.page_size,
         translation_language=filters.translation_language,
     )
 
-    filtered_reviews = _filter_reviews(reviews, filters)
-    logger.info(f"  🔍 Applied filters: {len(reviews)} → {len(filtered_reviews)} reviews")
-    
-    summary = summarize_reviews(filtered_reviews, filters, settings)
-    
-    response_data = ReviewsResponse(filters=filters, summary=summary, reviews=filtered_reviews)
-    
-    logger.info("="*100)
-    logger.info("📤 OUTGOING HTTP RESPONSE to Client")
-    logger.info("-"*100)
-    logger.info(f"  Status: 200 OK")
-    logger.info(f"  Total Reviews: {summary.total_reviews}")
-    logger.info(f"  Average Rating: {summary.average_rating}★")
-    logger.info(f"  Sentiment: +{summary.sentiment.positive} ={summary.sentiment.neutral} -{summary.sentiment.negative}")
-    logger.info(f"  Keywords: {', '.join(summary.top_keywords[:5])}")
-    logger.info("="*100)
-    
-    return response_data
+    filtered_reviews, summary = await run_in_threadpool(filter_and_summarize, reviews, filters)
+    if settings.ai_provider:
+        summary.ai_brief = await maybe_ai_brief(filtered_reviews, settings)
+    logger.info("  🔍 Applied filters: %d → %d reviews", len(reviews), len(filtered_reviews))
+
+    # Returning a pre-rendered Response skips FastAPI's response-model pass, which would
+    # otherwise validate and serialize every review on the event loop for async routes.
+    body = await run_in_threadpool(
+        _render_reviews_response, filters, summary, filtered_reviews
+    )
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(_SEP)
+        logger.info("📤 OUTGOING HTTP RESPONSE to Client")
+        logger.info(_DASH)
+        logger.info("  Status: 200 OK")
+        logger.info("  Total Reviews: %s", summary.total_reviews)
+        logger.info("  Average Rating: %s★", summary.average_rating)
+        logger.info(
+            "  Sentiment: +%s =%s -%s",
+            summary.sentiment.positive,
+            summary.sentiment.neutral,
+            summary.sentiment.negative,
+        )
+        logger.info("  Keywords: %s", ", ".join(summary.top_keywords[:5]))
+        logger.info(_SEP)
+
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/api/reviews/{review_id}", response_model=Review)
@@ -139,33 +161,35 @@ def get_review(
     client: GooglePlayReviewClient = Depends(get_client),
     settings: Settings = Depends(get_settings),
 ) -> Review:
-    logger.info("="*100)
-    logger.info("🌍 INCOMING HTTP REQUEST from Client")
-    logger.info("-"*100)
-    logger.info(f"  Method: {request.method}")
-    logger.info(f"  URL: {request.url}")
-    logger.info(f"  Client: {request.client.host if request.client else 'Unknown'}")
-    logger.info(f"  Path Parameters:")
-    logger.info(f"    - review_id: {review_id}")
-    logger.info(f"  Query Parameters:")
-    logger.info(f"    - package_name: {package_name}")
-    logger.info("="*100)
-    
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(_SEP)
+        logger.info("🌍 INCOMING HTTP REQUEST from Client")
+        logger.info(_DASH)
+        logger.info("  Method: %s", request.method)
+        logger.info("  URL: %s", request.url)
+        logger.info("  Client: %s", request.client.host if request.client else "Unknown")
+        logger.info("  Path Parameters:")
+        logger.info("    - review_id: %s", review_id)
+        logger.info("  Query Parameters:")
+        logger.info("    - package_name: %s", package_name)
+        logger.info(_SEP)
+
     resolved_package = package_name or settings.default_package_name
     if not resolved_package:
         raise HTTPException(status_code=400, detail="package_name is required")
 
     review = client.get_review(resolved_package, review_id)
     if not review:
-        logger.warning(f"⚠️  Review not found: {review_id}")
+        logger.warning("⚠️  Review not found: %s", review_id)
         raise HTTPException(status_code=404, detail="Review not found")
-    
-    logger.info("="*100)
-    logger.info("📤 OUTGOING HTTP RESPONSE to Client")
-    logger.info("-"*100)
-    logger.info(f"  Status: 200 OK")
-    logger.info(f"  Review ID: {review.reviewId}")
-    logger.info(f"  Author: {review.authorName}")
-    logger.info("="*100)
-    
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(_SEP)
+        logger.info("📤 OUTGOING HTTP RESPONSE to Client")
+        logger.info(_DASH)
+        logger.info("  Status: 200 OK")
+        logger.info("  Review ID: %s", review.reviewId)
+        logger.info("  Author: %s", review.authorName)
+        logger.info(_SEP)
+
     return review
@@ -1,15 +1,28 @@
 """Application entrypoint for FastAPI + templated UI."""
 from __future__ import annotations
 
+import logging
+
 from fastapi import Depends, FastAPI, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
 from .api.routes import router as api_router
 from .config import Settings, get_settings
 
-app = FastAPI(title="Google Play Reviews Explorer", version="0.1.0")
+# Logging is configured by the application entrypoint, not by library modules.
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(name)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+app = FastAPI(
+    title="Google Play Reviews Explorer",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+)
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 templates = Jinja2Templates(directory="templates")
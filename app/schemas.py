@@ -1,25 +1,84 @@
 """Pydantic schemas shared between the API layer and templates."""
 from __future__ import annotations
 
-from datetime import datetime
-from typing import List, Optional
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from functools import cached_property, lru_cache
+from typing import Any, List, Mapping, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 
-class Timestamp(BaseModel):
-    seconds: Optional[str] = None
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+@lru_cache(maxsize=4096)
+def _ts_to_dt(seconds: int, nanos: int) -> datetime:
+    """Convert a protobuf-style timestamp to an aware UTC datetime.
+
+    Plain integer arithmetic from the epoch, no platform ``fromtimestamp`` call. Reviews
+    commonly share ``lastModified`` values, so repeated pairs become a cache hit.
+    """
+    return _EPOCH + timedelta(seconds=seconds, microseconds=nanos // 1000)
+
+
+@lru_cache(maxsize=None)
+def _cached_property_names(cls: type) -> Tuple[str, ...]:
+    return tuple(
+        name
+        for klass in cls.__mro__
+        for name, attr in vars(klass).items()
+        if isinstance(attr, cached_property)
+    )
+
+
+class _SchemaModel(BaseModel):
+    """Base for the API schemas.
+
+    Validators are built on first use rather than at import. Review pages are validated
+    through ``REVIEW_LIST_ADAPTER`` below, which is still built eagerly.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+
+class _MemoizedModel(_SchemaModel):
+    """Base for models that memoize derived values with ``cached_property``.
+
+    The memoized values live in the instance ``__dict__``, which ``model_copy`` copies
+    verbatim; copies drop them so they are recomputed from the copied fields.
+    """
+
+    def model_copy(self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False):
+        copied = super().model_copy(update=update, deep=deep)
+        for name in _cached_property_names(type(self)):
+            copied.__dict__.pop(name, None)
+        return copied
+
+
+class Timestamp(_MemoizedModel):
+    model_config = ConfigDict(frozen=True)
+
+    # Google sends int64 seconds as a JSON string; Pydantic's lax mode coerces it once here.
+    seconds: Optional[int] = None
     nanos: Optional[int] = None
 
-    def to_datetime(self) -> Optional[datetime]:
+    @cached_property
+    def dt(self) -> Optional[datetime]:
+        """Timezone-aware UTC datetime, computed on first access."""
         if self.seconds is None:
             return None
-        seconds_int = int(self.seconds)
-        nanos = self.nanos or 0
-        return datetime.utcfromtimestamp(seconds_int + nanos / 1_000_000_000)
+        return _ts_to_dt(self.seconds, self.nanos or 0)
+
+    def to_datetime(self) -> Optional[datetime]:
+        dt = self.dt
+        return dt.replace(tzinfo=None) if dt else None
 
 
-class DeviceMetadata(BaseModel):
+class DeviceMetadata(_SchemaModel):
+    model_config = ConfigDict(frozen=True)
+
     productName: Optional[str] = None
     manufacturer: Optional[str] = None
     deviceClass: Optional[str] = None
@@ -33,7 +92,9 @@ class DeviceMetadata(BaseModel):
     ramMb: Optional[int] = None
 
 
-class UserComment(BaseModel):
+class UserComment(_SchemaModel):
+    model_config = ConfigDict(frozen=True)
+
     text: Optional[str] = None
     originalText: Optional[str] = None
     lastModified: Optional[Timestamp] = None
@@ -48,37 +109,94 @@ class UserComment(BaseModel):
     deviceMetadata: Optional[DeviceMetadata] = None
 
 
-class DeveloperComment(BaseModel):
+class DeveloperComment(_SchemaModel):
+    model_config = ConfigDict(frozen=True)
+
     text: Optional[str] = None
     lastModified: Optional[Timestamp] = None
 
 
-class Comment(BaseModel):
+class Comment(_SchemaModel):
+    model_config = ConfigDict(frozen=True)
+
     userComment: Optional[UserComment] = None
     developerComment: Optional[DeveloperComment] = None
 
 
-class Review(BaseModel):
+@dataclass
+class ReviewCompact:
+    """Flat, slotted projection of the review fields read by the summary pass."""
+
+    __slots__ = ("review_id", "star_rating", "text", "ts")
+
+    review_id: str
+    star_rating: Optional[int]
+    text: Optional[str]
+    ts: Optional[float]
+
+
+class Review(_MemoizedModel):
+    # Frozen all the way down, with ``comments`` stored as a tuple, so the memoized lookups
+    # cannot go stale; derive changed reviews via model_copy.
+    model_config = ConfigDict(frozen=True)
+
     reviewId: str
     authorName: Optional[str] = None
-    comments: List[Comment] = Field(default_factory=list)
+    comments: Tuple[Comment, ...] = ()
+
+    # Memoized: the filter and summary paths read these several times per review.
+    @cached_property
+    def _latest_comments(self) -> Tuple[Optional[UserComment], Optional[DeveloperComment]]:
+        """First user and developer comment, found in a single pass over ``comments``."""
+        user_comment = None
+        developer_comment = None
+        for comment in self.comments:
+            if user_comment is None and comment.userComment:
+                user_comment = comment.userComment
+            if developer_comment is None and comment.developerComment:
+                developer_comment = comment.developerComment
+            if user_comment is not None and developer_comment is not None:
+                break
+        return user_comment, developer_comment
 
     @property
     def latest_user_comment(self) -> Optional[UserComment]:
-        for comment in self.comments:
-            if comment.userComment:
-                return comment.userComment
-        return None
+        return self._latest_comments[0]
+
+    @cached_property
+    def compact(self) -> Optional[ReviewCompact]:
+        """Projection of the latest user comment, or ``None`` when there is none."""
+        user_comment = self.latest_user_comment
+        if user_comment is None:
+            return None
+        last_modified = user_comment.lastModified
+        ts = None
+        if last_modified is not None and last_modified.seconds is not None:
+            ts = last_modified.seconds + (last_modified.nanos or 0) / 1_000_000_000
+        return ReviewCompact(
+            review_id=self.reviewId,
+            star_rating=user_comment.starRating,
+            text=user_comment.text,
+            ts=ts,
+        )
 
     @property
     def latest_developer_comment(self) -> Optional[DeveloperComment]:
-        for comment in self.comments:
-            if comment.developerComment:
-                return comment.developerComment
-        return None
+        return self._latest_comments[1]
+
+
+# ``slots=`` needs Python 3.10; older interpreters fall back to a ``__dict__``-backed dataclass.
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class ReviewFilters:
+    """Immutable filter parameters for one list request.
 
+    A plain dataclass: the route validates query parameters at the boundary, so building
+    one per request skips Pydantic validation. ``ReviewsResponse`` still serializes it.
+    """
 
-class ReviewFilters(BaseModel):
     package_name: str
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
@@ -87,25 +205,49 @@ class ReviewFilters(BaseModel):
     translation_language: Optional[str] = None
     page_size: int = 50
     recent_activity_window_hours: int = 72
+    include_keywords: bool = True
 
 
-class SentimentSplit(BaseModel):
+@dataclass(**_DATACLASS_SLOTS)
+class SentimentSplit:
     positive: int = 0
     neutral: int = 0
     negative: int = 0
 
+    def __add__(self, other: SentimentSplit) -> SentimentSplit:
+        return SentimentSplit(
+            positive=self.positive + other.positive,
+            neutral=self.neutral + other.neutral,
+            negative=self.negative + other.negative,
+        )
 
-class ReviewSummary(BaseModel):
+    def __iadd__(self, other: SentimentSplit) -> SentimentSplit:
+        """Accumulate ``other`` in place, so aggregation loops allocate nothing."""
+        self.positive += other.positive
+        self.neutral += other.neutral
+        self.negative += other.negative
+        return self
+
+
+class ReviewSummary(_SchemaModel):
     total_reviews: int
     average_rating: float
     sentiment: SentimentSplit
     top_keywords: List[str]
     recent_activity_window_hours: int = 72
     recent_reviews: int = 0
+    total_keyword_tokens: int = 0
     ai_brief: Optional[str] = None
 
 
-class ReviewsResponse(BaseModel):
+class ReviewsResponse(_SchemaModel):
     filters: ReviewFilters
     summary: ReviewSummary
     reviews: List[Review]
+
+
+# Building a TypeAdapter compiles a core schema; share one per type instead of per call.
+get_adapter = lru_cache(maxsize=16)(TypeAdapter)
+
+# Validates a whole page of reviews with a single pre-built core validator.
+REVIEW_LIST_ADAPTER = get_adapter(List[Review])
@@ -1,33 +1,107 @@
 """Client wrapper around the Google Play Developer Reviews API."""
 from __future__ import annotations
 
-import json
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+from cachetools import TTLCache
 from google.oauth2 import service_account
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
 
 from ..config import Settings
-from ..schemas import Review
+from ..schemas import REVIEW_LIST_ADAPTER, Review
 
-# Configure logger with custom formatting
 logger = logging.getLogger(__name__)
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(name)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
+
+_SEP = "=" * 80
+_DASH = "-" * 80
 MOCK_REVIEWS_PATH = Path("sample_data/mock_reviews.json")
+REVIEWS_CACHE_MAXSIZE = 64
+
+_CacheKey = Tuple[str, int, Optional[str]]
+
+
+@lru_cache(maxsize=4)
+def _get_credentials(service_account_path: str, scopes: Tuple[str, ...]) -> Any:
+    """Read the service account key once per file and scope set; credentials are shared."""
+    return service_account.Credentials.from_service_account_file(
+        service_account_path,
+        scopes=list(scopes),
+    )
+
+
+@lru_cache(maxsize=4)
+def _get_service(service_account_path: str, scopes: Tuple[str, ...]) -> Any:
+    """Build the androidpublisher service once per credentials file and scope set.
+
+    Clients are reused across requests, but parsing the discovery document is the
+    expensive part of ``build()``, so it happens once per process. The service is shared
+    by every thread; requests are executed over a per-thread transport (see ``_execute``).
+    """
+    # Build the Google Play Developer API service client.
+    # This automatically configures the correct base URL:
+    # https://androidpublisher.googleapis.com/androidpublisher/v3/
+    return build(
+        "androidpublisher",  # Service name
+        "v3",                # API version
+        credentials=_get_credentials(service_account_path, scopes),
+        cache_discovery=False,
+    )
+
+
+def _authorized_http(credentials: Any) -> Any:
+    """Return a new authorized transport; httplib2 connections must not cross threads."""
+    return AuthorizedHttp(credentials, http=build_http())
+
+
+# Per-thread transports, keyed like the service, so network calls never share a connection.
+_THREAD_STATE = threading.local()
+
+
+def _thread_http(service_account_path: str, scopes: Tuple[str, ...]) -> Any:
+    https = getattr(_THREAD_STATE, "https", None)
+    if https is None:
+        https = _THREAD_STATE.https = {}
+    key = (service_account_path, scopes)
+    http = https.get(key)
+    if http is None:
+        http = https[key] = _authorized_http(_get_credentials(service_account_path, scopes))
+    return http
+
+
+def _clear_service_cache() -> None:
+    """Forget the cached credentials, services and the calling thread's transports."""
+    _get_credentials.cache_clear()
+    _get_service.cache_clear()
+    _THREAD_STATE.https = {}
+
+
+@lru_cache(maxsize=1)
+def _load_mock_reviews() -> List[Review]:
+    """Parse the mock payload once per process; clients are short-lived, the data is not."""
+    if not MOCK_REVIEWS_PATH.exists():
+        logger.warning("Mock data file missing at %s", MOCK_REVIEWS_PATH)
+        return []
+
+    # pydantic-core parses and validates the raw bytes in one pass, with no dict tree.
+    return REVIEW_LIST_ADAPTER.validate_json(MOCK_REVIEWS_PATH.read_bytes())
 
 
 class GooglePlayReviewClient:
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
-        self._service = None
-        self._mock_reviews: Optional[List[Review]] = None
+        self._reviews_cache: TTLCache[_CacheKey, List[Review]] = TTLCache(
+            maxsize=REVIEWS_CACHE_MAXSIZE,
+            ttl=max(settings.cache_ttl_seconds, 0),
+        )
+        self._cache_lock = threading.Lock()
 
     # ------------------------------------------------------------------
     # Public API
@@ -38,202 +112,220 @@ class GooglePlayReviewClient:
         page_size: int,
         translation_language: Optional[str] = None,
     ) -> List[Review]:
-        logger.info("="*80)
-        logger.info("📥 INCOMING REQUEST: list_reviews()")
-        logger.info("-"*80)
-        logger.info(f"  Package Name: {package_name}")
-        logger.info(f"  Page Size: {page_size}")
-        logger.info(f"  Translation Language: {translation_language or 'None'}")
-        logger.info(f"  Mock Mode: {self.settings.enable_mock_mode}")
-        logger.info("="*80)
-        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(_SEP)
+            logger.info("📥 INCOMING REQUEST: list_reviews()")
+            logger.info(_DASH)
+            logger.info("  Package Name: %s", package_name)
+            logger.info("  Page Size: %s", page_size)
+            logger.info("  Translation Language: %s", translation_language or "None")
+            logger.info("  Mock Mode: %s", self.settings.enable_mock_mode)
+            logger.info(_SEP)
+
         if self.settings.enable_mock_mode:
             logger.info("🔧 Using MOCK data (no Google API call)")
             reviews = self._list_mock_reviews()
-            logger.info(f"✅ Returned {len(reviews)} mock reviews")
+            logger.info("✅ Returned %d mock reviews", len(reviews))
             return reviews
 
-        raw_reviews = list(
-            self._iterate_reviews_api(
-                package_name=package_name,
-                page_size=page_size,
-                translation_language=translation_language,
-            )
-        )
-        validated_reviews = [Review.model_validate(review) for review in raw_reviews]
-        
-        logger.info("="*80)
-        logger.info(f"✅ Successfully fetched {len(validated_reviews)} reviews from Google Play")
-        logger.info("="*80)
-        
+        cache_key = (package_name, page_size, translation_language)
+        with self._cache_lock:
+            cached_reviews = self._reviews_cache.get(cache_key)
+        if cached_reviews is not None:
+            logger.info("⚡ Returned %d cached reviews", len(cached_reviews))
+            return cached_reviews
+
+        validated_reviews: List[Review] = []
+        for page in self._iterate_review_pages(
+            package_name=package_name,
+            page_size=page_size,
+            translation_language=translation_language,
+        ):
+            validated_reviews.extend(REVIEW_LIST_ADAPTER.validate_python(page))
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(_SEP)
+            logger.info("✅ Successfully fetched %d reviews from Google Play", len(validated_reviews))
+            logger.info(_SEP)
+
+        if self.settings.cache_ttl_seconds > 0:
+            with self._cache_lock:
+                self._reviews_cache[cache_key] = validated_reviews
         return validated_reviews
 
+    def invalidate_cache(self) -> None:
+        """Drop cached ``list_reviews`` results so the next call hits Google again."""
+        with self._cache_lock:
+            self._reviews_cache.clear()
+
     def get_review(self, package_name: str, review_id: str) -> Optional[Review]:
-        logger.info("="*80)
-        logger.info("📥 INCOMING REQUEST: get_review()")
-        logger.info("-"*80)
-        logger.info(f"  Package Name: {package_name}")
-        logger.info(f"  Review ID: {review_id}")
-        logger.info(f"  Mock Mode: {self.settings.enable_mock_mode}")
-        logger.info("="*80)
-        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(_SEP)
+            logger.info("📥 INCOMING REQUEST: get_review()")
+            logger.info(_DASH)
+            logger.info("  Package Name: %s", package_name)
+            logger.info("  Review ID: %s", review_id)
+            logger.info("  Mock Mode: %s", self.settings.enable_mock_mode)
+            logger.info(_SEP)
+
         if self.settings.enable_mock_mode:
             logger.info("🔧 Using MOCK data (no Google API call)")
             mock_reviews = self._list_mock_reviews()
             for review in mock_reviews:
                 if review.reviewId == review_id:
-                    logger.info(f"✅ Found mock review: {review_id}")
+                    logger.info("✅ Found mock review: %s", review_id)
                     return review
-            logger.warning(f"⚠️  Mock review not found: {review_id}")
+            logger.warning("⚠️  Mock review not found: %s", review_id)
             return None
 
         service = self._build_service()
-        
+
         logger.info("🌐 OUTGOING REQUEST to Google Play API")
-        logger.info(f"  → GET /applications/{package_name}/reviews/{review_id}")
-        
+        logger.info("  → GET /applications/%s/reviews/%s", package_name, review_id)
+
         try:
             # Calls: GET https://androidpublisher.googleapis.com/androidpublisher/v3/
             #        applications/{packageName}/reviews/{reviewId}
-            response = (
-                service.reviews()
-                .get(packageName=package_name, reviewId=review_id)
-                .execute()
+            response = self._execute(
+                service.reviews().get(packageName=package_name, reviewId=review_id)
             )
-            
-            logger.info("📦 RESPONSE from Google Play API")
-            logger.info(f"  Review ID: {response.get('reviewId', 'N/A')}")
-            logger.info(f"  Author: {response.get('authorName', 'N/A')}")
-            logger.info(f"  Comments Count: {len(response.get('comments', []))}")
-            logger.info(f"✅ Successfully fetched review: {review_id}")
-            
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("📦 RESPONSE from Google Play API")
+                logger.info("  Review ID: %s", response.get("reviewId", "N/A"))
+                logger.info("  Author: %s", response.get("authorName", "N/A"))
+                logger.info("  Comments Count: %d", len(response.get("comments", [])))
+                logger.info("✅ Successfully fetched review: %s", review_id)
+
         except HttpError as exc:  # pragma: no cover - network
-            logger.error("="*80)
-            logger.error(f"❌ Google Play get() FAILED: {exc}")
-            logger.error("="*80)
+            logger.error(_SEP)
+            logger.error("❌ Google Play get() FAILED: %s", exc)
+            logger.error(_SEP)
             raise
-            
+
         return Review.model_validate(response)
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
-    def _build_service(self):
-        if self._service is not None:
-            return self._service
-
+    def _service_key(self) -> Tuple[str, Tuple[str, ...]]:
         service_account_path = self.settings.google_service_account_file
         if not service_account_path or service_account_path.startswith("TODO"):
             raise RuntimeError(
                 "google_service_account_file is not configured. "
                 "Update .env or set the environment variable."
             )
+        return service_account_path, tuple(self.settings.google_play_scopes)
 
-        credentials = service_account.Credentials.from_service_account_file(
-            service_account_path,
-            scopes=self.settings.google_play_scopes,
-        )
-        # Build the Google Play Developer API service client.
-        # This automatically configures the correct base URL:
-        # https://androidpublisher.googleapis.com/androidpublisher/v3/
-        self._service = build(
-            "androidpublisher",  # Service name
-            "v3",                # API version
-            credentials=credentials,
-            cache_discovery=False,
-        )
-        return self._service
+    def _build_service(self):
+        return _get_service(*self._service_key())
 
-    def _iterate_reviews_api(
+    def _execute(self, request: Any) -> Dict:
+        """Execute ``request`` over the calling thread's transport, not the shared one."""
+        return request.execute(http=_thread_http(*self._service_key()))
+
+    def _iterate_review_pages(
         self,
         package_name: str,
         page_size: int,
         translation_language: Optional[str] = None,
-    ) -> Iterable[Dict]:
+    ) -> Iterator[List[Dict]]:
+        """Yield raw review pages, prefetching the next page while the caller consumes one.
+
+        The page token only becomes known once a response arrives, so pages are still
+        requested in order; the overlap is between the network wait for page ``n + 1``
+        and the caller's validation of page ``n``.
+        """
         service = self._build_service()
         max_results = min(max(page_size, 1), 100)
-        
+
         page_num = 1
         total_fetched = 0
-        
-        # Calls: GET https://androidpublisher.googleapis.com/androidpublisher/v3/
-        #        applications/{packageName}/reviews?maxResults={max_results}
-        request = service.reviews().list(
-            packageName=package_name,
-            translationLanguage=translation_language,
-            maxResults=max_results,
-        )
 
-        while request is not None:
-            logger.info("🌐 OUTGOING REQUEST to Google Play API")
-            logger.info(f"  → GET /applications/{package_name}/reviews")
-            logger.info(f"  Parameters:")
-            logger.info(f"    - maxResults: {max_results}")
-            logger.info(f"    - translationLanguage: {translation_language or 'None'}")
-            logger.info(f"    - page: {page_num}")
-            
-            try:
-                response = request.execute()
-                
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="play-reviews") as executor:
+            # Calls: GET https://androidpublisher.googleapis.com/androidpublisher/v3/
+            #        applications/{packageName}/reviews?maxResults={max_results}
+            self._log_list_request(package_name, max_results, translation_language, page_num)
+            request = service.reviews().list(
+                packageName=package_name,
+                translationLanguage=translation_language,
+                maxResults=max_results,
+            )
+            pending: Optional[Future] = executor.submit(self._execute, request)
+
+            while pending is not None:
+                try:
+                    response = pending.result()
+                except HttpError as exc:  # pragma: no cover - network
+                    logger.error(_SEP)
+                    logger.error("❌ Google Play list() FAILED on page %s", page_num)
+                    logger.error("  Error: %s", exc)
+                    logger.error(_SEP)
+                    raise
+
                 reviews_in_page = response.get("reviews", [])
                 reviews_count = len(reviews_in_page)
                 total_fetched += reviews_count
-                
-                logger.info("📦 RESPONSE from Google Play API")
-                logger.info(f"  Reviews in this page: {reviews_count}")
-                logger.info(f"  Total fetched so far: {total_fetched}")
-                
-                # Pretty print first review as sample
-                if reviews_in_page and page_num == 1:
-                    sample = reviews_in_page[0]
-                    logger.info("  Sample Review (first one):")
-                    logger.info(f"    - ID: {sample.get('reviewId', 'N/A')}")
-                    logger.info(f"    - Author: {sample.get('authorName', 'N/A')}")
-                    comments = sample.get('comments', [])
-                    if comments and comments[0].get('userComment'):
-                        user_comment = comments[0]['userComment']
-                        rating = user_comment.get('starRating', 'N/A')
-                        text = user_comment.get('text', '')[:80]
-                        logger.info(f"    - Rating: {rating}★")
-                        logger.info(f"    - Text: {text}{'...' if len(user_comment.get('text', '')) > 80 else ''}")
-                
-            except HttpError as exc:  # pragma: no cover - network
-                logger.error("="*80)
-                logger.error(f"❌ Google Play list() FAILED on page {page_num}")
-                logger.error(f"  Error: {exc}")
-                logger.error("="*80)
-                raise
-
-            yield from reviews_in_page
-            
-            # Handle pagination using token from response
-            token_pagination = response.get("tokenPagination", {})
-            next_token = token_pagination.get("nextPageToken")
-            
-            if next_token:
-                logger.info(f"  → Has more pages, fetching next...")
-                logger.info(f"  → Next page token: {next_token[:20]}...")
-                page_num += 1
-                request = service.reviews().list(
-                    packageName=package_name,
-                    translationLanguage=translation_language,
-                    maxResults=max_results,
-                    token=next_token,
-                )
-            else:
-                logger.info(f"  ✅ No more pages. Total reviews fetched: {total_fetched}")
-                request = None
+
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("📦 RESPONSE from Google Play API")
+                    logger.info("  Reviews in this page: %d", reviews_count)
+                    logger.info("  Total fetched so far: %d", total_fetched)
+
+                    # Pretty print first review as sample
+                    if reviews_in_page and page_num == 1:
+                        self._log_sample_review(reviews_in_page[0])
+
+                # Handle pagination using token from response
+                token_pagination = response.get("tokenPagination", {})
+                next_token = token_pagination.get("nextPageToken")
+
+                if next_token:
+                    logger.info("  → Has more pages, fetching next...")
+                    logger.info("  → Next page token: %s...", next_token[:20])
+                    page_num += 1
+                    self._log_list_request(
+                        package_name, max_results, translation_language, page_num
+                    )
+                    request = service.reviews().list(
+                        packageName=package_name,
+                        translationLanguage=translation_language,
+                        maxResults=max_results,
+                        token=next_token,
+                    )
+                    pending = executor.submit(self._execute, request)
+                else:
+                    logger.info("  ✅ No more pages. Total reviews fetched: %d", total_fetched)
+                    pending = None
+
+                yield reviews_in_page
+
+    @staticmethod
+    def _log_list_request(
+        package_name: str,
+        max_results: int,
+        translation_language: Optional[str],
+        page_num: int,
+    ) -> None:
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("🌐 OUTGOING REQUEST to Google Play API")
+            logger.info("  → GET /applications/%s/reviews", package_name)
+            logger.info("  Parameters:")
+            logger.info("    - maxResults: %s", max_results)
+            logger.info("    - translationLanguage: %s", translation_language or "None")
+            logger.info("    - page: %s", page_num)
+
+    @staticmethod
+    def _log_sample_review(sample: Dict) -> None:
+        logger.info("  Sample Review (first one):")
+        logger.info("    - ID: %s", sample.get("reviewId", "N/A"))
+        logger.info("    - Author: %s", sample.get("authorName", "N/A"))
+        comments = sample.get("comments", [])
+        if comments and comments[0].get("userComment"):
+            user_comment = comments[0]["userComment"]
+            full_text = user_comment.get("text", "")
+            logger.info("    - Rating: %s★", user_comment.get("starRating", "N/A"))
+            logger.info("    - Text: %s%s", full_text[:80], "..." if len(full_text) > 80 else "")
 
     def _list_mock_reviews(self) -> List[Review]:
-        if self._mock_reviews is not None:
-            return self._mock_reviews
-
-        if not MOCK_REVIEWS_PATH.exists():
-            logger.warning("Mock data file missing at %s", MOCK_REVIEWS_PATH)
-            self._mock_reviews = []
-            return self._mock_reviews
-
-        with MOCK_REVIEWS_PATH.open("r", encoding="utf-8") as handle:
-            payload = json.load(handle)
-        self._mock_reviews = [Review.model_validate(review) for review in payload]
-        return self._mock_reviews
+        return _load_mock_reviews()
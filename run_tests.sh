@@ -55,22 +55,22 @@ case "$TEST_MODE" in
     
     integration)
         echo -e "${BLUE}🔗 Running INTEGRATION tests only...${NC}"
-        pytest tests/integration/ -v --tb=short
+        pytest tests/integration/ -v --tb=short --run-integration
         ;;
     
     fast)
         echo -e "${BLUE}⚡ Running all tests (fast mode, no coverage)...${NC}"
-        pytest tests/ -v --tb=short
+        pytest tests/ -v --tb=short --run-integration
         ;;
     
     verbose)
         echo -e "${BLUE}📝 Running all tests (verbose mode with coverage)...${NC}"
-        pytest tests/ -vv --tb=long --cov=app --cov-report=term-missing --cov-report=html
+        pytest tests/ -vv --tb=long --run-integration --cov=app --cov-report=term-missing --cov-report=html
         ;;
     
     coverage)
         echo -e "${BLUE}📊 Running tests with detailed coverage report...${NC}"
-        pytest tests/ -v --cov=app --cov-report=term-missing --cov-report=html --cov-branch
+        pytest tests/ -v --run-integration --cov=app --cov-report=term-missing --cov-report=html --cov-branch
         echo ""
         echo -e "${GREEN}✅ Coverage report generated in htmlcov/index.html${NC}"
         ;;
@@ -82,12 +82,12 @@ case "$TEST_MODE" in
             exit 1
         fi
         echo -e "${BLUE}🎯 Running specific test: $2${NC}"
-        pytest "$2" -v --tb=short
+        pytest "$2" -v --tb=short --run-integration
         ;;
     
     all|*)
         echo -e "${BLUE}🚀 Running ALL tests with coverage...${NC}"
-        pytest tests/ -v --tb=short --cov=app --cov-report=term-missing --cov-report=html
+        pytest tests/ -v --tb=short --run-integration --cov=app --cov-report=term-missing --cov-report=html
         ;;
 esac
 
@@ -4,18 +4,75 @@ from __future__ import annotations
 import json
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Generator
-from unittest.mock import MagicMock, patch
+from typing import TYPE_CHECKING, Generator
+from unittest.mock import Mock, patch
 
 import pytest
-from fastapi.testclient import TestClient
 
 from app.config import Settings, get_settings
-from app.main import app
 from app.schemas import Comment, DeveloperComment, Review, Timestamp, UserComment
 
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
+    from httpx import ASGITransport
 
-@pytest.fixture
+
+def pytest_addoption(parser):
+    """Register the opt-in flag for integration tests."""
+    parser.addoption(
+        "--run-integration",
+        action="store_true",
+        default=False,
+        help="run tests marked as integration (skipped by default)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip integration tests unless ``--run-integration`` is given."""
+    if config.getoption("--run-integration"):
+        return
+    skip_integration = pytest.mark.skip(reason="need --run-integration option to run")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_integration)
+
+
+# Canned Google Play API responses, built once at import time and shared by the
+# service mock. Tests only read these, so reusing the same dicts is safe.
+_GOOGLE_REVIEW_PAYLOAD = {
+    "reviewId": "goog-review-1",
+    "authorName": "Google User",
+    "comments": [
+        {
+            "userComment": {
+                "text": "Excellent app!",
+                "lastModified": {"seconds": "1731600000", "nanos": 0},
+                "starRating": 5,
+                "reviewerLanguage": "en",
+                "appVersionName": "1.0.0",
+                "thumbsUpCount": 15,
+                "thumbsDownCount": 0,
+            }
+        }
+    ],
+}
+
+_LIST_PAYLOAD = {
+    "reviews": [_GOOGLE_REVIEW_PAYLOAD],
+    "tokenPagination": {},
+}
+
+_GET_PAYLOAD = _GOOGLE_REVIEW_PAYLOAD
+
+_REPLY_PAYLOAD = {
+    "result": {
+        "replyText": "Thank you!",
+        "lastEdited": {"seconds": "1731700000", "nanos": 0},
+    }
+}
+
+
+@pytest.fixture(scope="session")
 def test_settings() -> Settings:
     """Create test settings with mock mode enabled."""
     return Settings(
@@ -28,16 +85,21 @@ def test_settings() -> Settings:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_timestamp() -> Timestamp:
-    """Create a mock timestamp."""
-    return Timestamp(seconds="1731600000", nanos=0)
+    """Create a mock timestamp.
 
+    Fixture data is trusted, so the fixtures build models with ``model_construct``
+    and skip validation. Values must already have their validated types (e.g. int
+    seconds, not the string Google sends).
+    """
+    return Timestamp.model_construct(seconds=1731600000, nanos=0)
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def mock_user_comment(mock_timestamp: Timestamp) -> UserComment:
     """Create a mock user comment."""
-    return UserComment(
+    return UserComment.model_construct(
         text="Great app! Love the new features.",
         originalText=None,
         lastModified=mock_timestamp,
@@ -53,192 +115,174 @@ def mock_user_comment(mock_timestamp: Timestamp) -> UserComment:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_developer_comment(mock_timestamp: Timestamp) -> DeveloperComment:
     """Create a mock developer comment."""
-    return DeveloperComment(
+    return DeveloperComment.model_construct(
         text="Thank you for your feedback!",
         lastModified=mock_timestamp,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_review(
     mock_user_comment: UserComment,
     mock_developer_comment: DeveloperComment,
 ) -> Review:
     """Create a mock review."""
-    return Review(
+    return Review.model_construct(
         reviewId="test-review-123",
         authorName="Test User",
-        comments=[
-            Comment(
+        comments=(
+            Comment.model_construct(
                 userComment=mock_user_comment,
                 developerComment=None,
             ),
-            Comment(
+            Comment.model_construct(
                 userComment=None,
                 developerComment=mock_developer_comment,
             ),
-        ],
+        ),
     )
 
 
-@pytest.fixture
-def mock_reviews_list(mock_review: Review) -> list[Review]:
-    """Create a list of mock reviews with different ratings."""
-    reviews = [mock_review]
-    
-    # Add a negative review
-    negative_review = Review(
-        reviewId="test-review-456",
-        authorName="Angry User",
-        comments=[
-            Comment(
-                userComment=UserComment(
-                    text="App crashes constantly!",
-                    originalText=None,
-                    lastModified=Timestamp(seconds="1731600000", nanos=0),
-                    starRating=1,
-                    reviewerLanguage="en",
-                    device=None,
-                    androidOsVersion=None,
-                    appVersionCode=None,
-                    appVersionName="1.0.0",
-                    thumbsUpCount=5,
-                    thumbsDownCount=0,
-                    deviceMetadata=None,
-                ),
-                developerComment=None,
-            ),
-        ],
-    )
-    
-    # Add a neutral review
-    neutral_review = Review(
-        reviewId="test-review-789",
-        authorName="Neutral User",
-        comments=[
-            Comment(
-                userComment=UserComment(
-                    text="It's okay, nothing special.",
-                    originalText=None,
-                    lastModified=Timestamp(seconds="1731600000", nanos=0),
-                    starRating=3,
-                    reviewerLanguage="en",
-                    device=None,
-                    androidOsVersion=None,
-                    appVersionCode=None,
-                    appVersionName="1.0.0",
-                    thumbsUpCount=2,
-                    thumbsDownCount=1,
-                    deviceMetadata=None,
+# (reviewId, authorName, text, starRating, thumbsUpCount, thumbsDownCount)
+_EXTRA_REVIEW_SPECS = (
+    ("test-review-456", "Angry User", "App crashes constantly!", 1, 5, 0),
+    ("test-review-789", "Neutral User", "It's okay, nothing special.", 3, 2, 1),
+)
+
+
+@pytest.fixture(scope="session")
+def mock_reviews_list(mock_review: Review) -> tuple[Review, ...]:
+    """Create mock reviews with different ratings.
+
+    Session-scoped, so it is returned as a tuple to keep tests from mutating it.
+    """
+    # mock_review, followed by the negative and neutral reviews from the spec table
+    return (mock_review,) + tuple(
+        Review.model_construct(
+            reviewId=review_id,
+            authorName=author_name,
+            comments=(
+                Comment.model_construct(
+                    userComment=UserComment.model_construct(
+                        text=text,
+                        originalText=None,
+                        lastModified=Timestamp.model_construct(seconds=1731600000, nanos=0),
+                        starRating=star_rating,
+                        reviewerLanguage="en",
+                        device=None,
+                        androidOsVersion=None,
+                        appVersionCode=None,
+                        appVersionName="1.0.0",
+                        thumbsUpCount=thumbs_up,
+                        thumbsDownCount=thumbs_down,
+                        deviceMetadata=None,
+                    ),
+                    developerComment=None,
                 ),
-                developerComment=None,
             ),
-        ],
+        )
+        for review_id, author_name, text, star_rating, thumbs_up, thumbs_down in _EXTRA_REVIEW_SPECS
     )
-    
-    reviews.extend([negative_review, neutral_review])
-    return reviews
 
 
-@pytest.fixture
-def test_client() -> Generator[TestClient, None, None]:
-    """Create a test client for the FastAPI app."""
-    with TestClient(app) as client:
-        yield client
-
-
-@pytest.fixture(autouse=True)
-def override_settings(test_settings: Settings):
-    """Override application settings for tests."""
-    # Clear cached settings before overriding
-    get_settings.cache_clear()
+@pytest.fixture(scope="session")
+def settings_override(test_settings: Settings):
+    """Dependency override that injects the test settings."""
 
     def _get_settings_override():
         return test_settings
 
-    app.dependency_overrides[get_settings] = _get_settings_override
+    return _get_settings_override
+
+
+@pytest.fixture(scope="session")
+def override_settings(settings_override):
+    """Override application settings for the tests that drive the app.
 
-    yield
+    Not autouse: only ``test_client`` and ``asgi_transport`` pull it in, so unit
+    tests never touch ``app.dependency_overrides``. ``app.main`` is imported here
+    so unit-only runs never load FastAPI or the Google API client stack. Yields
+    the app with the override installed.
+    """
+    from app.main import app
+
+    # Clear cached settings before overriding
+    get_settings.cache_clear()
+    app.dependency_overrides[get_settings] = settings_override
+
+    yield app
 
     app.dependency_overrides.pop(get_settings, None)
     get_settings.cache_clear()
 
 
-@pytest.fixture
-def mock_google_service():
-    """Mock the Google API service."""
-    mock_service = MagicMock()
-    mock_reviews_resource = MagicMock()
+@pytest.fixture(scope="session")
+def test_client(override_settings) -> Generator[TestClient, None, None]:
+    """Create a test client for the FastAPI app, started once per session."""
+    from fastapi.testclient import TestClient
+
+    app = override_settings
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def asgi_transport(override_settings) -> ASGITransport:
+    """ASGI transport for calling the app from async tests without ``TestClient``.
+
+    Tests open their own ``httpx.AsyncClient`` on top of it, so each client lives
+    on the event loop of the test that uses it.
+    """
+    from httpx import ASGITransport
+
+    app = override_settings
+    return ASGITransport(app=app)
+
+
+@pytest.fixture(scope="session")
+def _mock_google_service_graph():
+    """Build the Google API service mock tree once per session.
+
+    ``spec_set`` mocks only expose the attributes the client actually uses, so
+    no child mocks are created on stray attribute access.
+    """
+    mock_service = Mock(spec_set=["reviews"])
+    mock_reviews_resource = Mock(spec_set=["list", "get", "reply"])
     mock_service.reviews.return_value = mock_reviews_resource
     
     # Mock list response
-    mock_list_request = MagicMock()
-    mock_list_request.execute.return_value = {
-        "reviews": [
-            {
-                "reviewId": "goog-review-1",
-                "authorName": "Google User",
-                "comments": [
-                    {
-                        "userComment": {
-                            "text": "Excellent app!",
-                            "lastModified": {"seconds": "1731600000", "nanos": 0},
-                            "starRating": 5,
-                            "reviewerLanguage": "en",
-                            "appVersionName": "1.0.0",
-                            "thumbsUpCount": 15,
-                            "thumbsDownCount": 0,
-                        }
-                    }
-                ],
-            }
-        ],
-        "tokenPagination": {},
-    }
+    mock_list_request = Mock(spec_set=["execute"])
+    mock_list_request.execute.return_value = _LIST_PAYLOAD
     mock_reviews_resource.list.return_value = mock_list_request
     
     # Mock get response
-    mock_get_request = MagicMock()
-    mock_get_request.execute.return_value = {
-        "reviewId": "goog-review-1",
-        "authorName": "Google User",
-        "comments": [
-            {
-                "userComment": {
-                    "text": "Excellent app!",
-                    "lastModified": {"seconds": "1731600000", "nanos": 0},
-                    "starRating": 5,
-                    "reviewerLanguage": "en",
-                    "appVersionName": "1.0.0",
-                    "thumbsUpCount": 15,
-                    "thumbsDownCount": 0,
-                }
-            }
-        ],
-    }
+    mock_get_request = Mock(spec_set=["execute"])
+    mock_get_request.execute.return_value = _GET_PAYLOAD
     mock_reviews_resource.get.return_value = mock_get_request
     
     # Mock reply response
-    mock_reply_request = MagicMock()
-    mock_reply_request.execute.return_value = {
-        "result": {
-            "replyText": "Thank you!",
-            "lastEdited": {"seconds": "1731700000", "nanos": 0},
-        }
-    }
+    mock_reply_request = Mock(spec_set=["execute"])
+    mock_reply_request.execute.return_value = _REPLY_PAYLOAD
     mock_reviews_resource.reply.return_value = mock_reply_request
     
     return mock_service
 
 
+@pytest.fixture
+def mock_google_service(_mock_google_service_graph):
+    """Mock the Google API service, with call history cleared for each test."""
+    _mock_google_service_graph.reset_mock()
+    return _mock_google_service_graph
+
+
 @pytest.fixture
 def mock_service_account_credentials():
     """Mock service account credentials."""
     with patch("app.services.google_play_client.service_account.Credentials") as mock_creds:
-        mock_creds.from_service_account_file.return_value = MagicMock()
+        mock_creds.from_service_account_file.return_value = Mock()
         yield mock_creds
 
 
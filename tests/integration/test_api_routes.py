@@ -1,17 +1,30 @@
 """Integration tests for API routes."""
 from __future__ import annotations
 
+import asyncio
+from unittest.mock import patch
+
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 
 
+@pytest.fixture(scope="module")
+def default_reviews_response(test_client: TestClient):
+    """Fetch ``/api/reviews`` with default parameters once for the whole module."""
+    response = test_client.get("/api/reviews")
+    return response.status_code, response.json()
+
+
 @pytest.mark.integration
 class TestHealthCheck:
     """Tests for health check endpoint."""
 
-    def test_healthz_endpoint(self, test_client: TestClient):
+    @pytest.mark.asyncio
+    async def test_healthz_endpoint(self, asgi_transport: httpx.ASGITransport):
         """Test the health check endpoint."""
-        response = test_client.get("/healthz")
+        async with httpx.AsyncClient(transport=asgi_transport, base_url="http://test") as client:
+            response = await client.get("/healthz")
         assert response.status_code == 200
         assert response.json() == {"status": "ok"}
 
@@ -20,51 +33,50 @@ class TestHealthCheck:
 class TestReviewsList:
     """Tests for reviews list endpoint."""
 
-    def test_list_reviews_default(self, test_client: TestClient):
+    def test_list_reviews_default(self, default_reviews_response):
         """Test listing reviews with default parameters."""
-        response = test_client.get("/api/reviews")
-        
-        assert response.status_code == 200
-        data = response.json()
-        
+        status_code, data = default_reviews_response
+
+        assert status_code == 200
         assert "filters" in data
         assert "summary" in data
         assert "reviews" in data
         assert isinstance(data["reviews"], list)
 
-    def test_list_reviews_with_package_name(self, test_client: TestClient):
-        """Test listing reviews with package name."""
-        response = test_client.get("/api/reviews?package_name=com.test.app")
+    @pytest.mark.parametrize(
+        "query,expected_filters",
+        [
+            ("package_name=com.test.app", {"package_name": "com.test.app"}),
+            ("page_size=10", {"page_size": 10}),
+            ("min_rating=4&max_rating=5", {"min_rating": 4, "max_rating": 5}),
+            ("translation_language=en", {"translation_language": "en"}),
+        ],
+        ids=["package_name", "page_size", "rating_filter", "translation"],
+    )
+    @pytest.mark.asyncio
+    async def test_list_reviews_with_query_params(
+        self,
+        asgi_transport: httpx.ASGITransport,
+        query: str,
+        expected_filters: dict,
+    ):
+        """Test that query parameters are echoed back in the filters."""
+        async with httpx.AsyncClient(transport=asgi_transport, base_url="http://test") as client:
+            response = await client.get(f"/api/reviews?{query}")
         
         assert response.status_code == 200
         data = response.json()
         
-        assert data["filters"]["package_name"] == "com.test.app"
+        for key, value in expected_filters.items():
+            assert data["filters"][key] == value
 
-    def test_list_reviews_with_page_size(self, test_client: TestClient):
-        """Test listing reviews with custom page size."""
-        response = test_client.get("/api/reviews?page_size=10")
-        
-        assert response.status_code == 200
-        data = response.json()
-        
-        assert data["filters"]["page_size"] == 10
-
-    def test_list_reviews_with_rating_filter(self, test_client: TestClient):
-        """Test listing reviews with rating filters."""
-        response = test_client.get("/api/reviews?min_rating=4&max_rating=5")
-        
-        assert response.status_code == 200
-        data = response.json()
-        
-        assert data["filters"]["min_rating"] == 4
-        assert data["filters"]["max_rating"] == 5
-
-    def test_list_reviews_with_dates(self, test_client: TestClient):
+    @pytest.mark.asyncio
+    async def test_list_reviews_with_dates(self, asgi_transport: httpx.ASGITransport):
         """Test listing reviews with date filters."""
-        response = test_client.get(
-            "/api/reviews?start_date=2024-01-01T00:00:00Z&end_date=2024-12-31T23:59:59Z"
-        )
+        async with httpx.AsyncClient(transport=asgi_transport, base_url="http://test") as client:
+            response = await client.get(
+                "/api/reviews?start_date=2024-01-01T00:00:00Z&end_date=2024-12-31T23:59:59Z"
+            )
         
         assert response.status_code == 200
         data = response.json()
@@ -72,27 +84,41 @@ class TestReviewsList:
         assert data["filters"]["start_date"] is not None
         assert data["filters"]["end_date"] is not None
 
-    def test_list_reviews_with_translation(self, test_client: TestClient):
-        """Test listing reviews with translation language."""
-        response = test_client.get("/api/reviews?translation_language=en")
-        
+    @pytest.mark.asyncio
+    async def test_list_reviews_without_keywords(self, asgi_transport: httpx.ASGITransport):
+        """Test that keyword extraction can be switched off."""
+        async with httpx.AsyncClient(transport=asgi_transport, base_url="http://test") as client:
+            response = await client.get("/api/reviews?include_keywords=false")
+
         assert response.status_code == 200
         data = response.json()
-        
-        assert data["filters"]["translation_language"] == "en"
 
-    def test_list_reviews_invalid_rating(self, test_client: TestClient):
-        """Test listing reviews with invalid rating."""
-        response = test_client.get("/api/reviews?min_rating=6")
+        assert data["filters"]["include_keywords"] is False
+        assert data["summary"]["top_keywords"] == []
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "min_rating=6",
+            "min_rating=0",
+            "max_rating=10",
+            "page_size=0",
+            "page_size=1000000",
+            "recent_window_hours=0",
+            "translation_language=e",
+        ],
+    )
+    def test_list_reviews_invalid_params(self, test_client: TestClient, query: str):
+        """Test that out-of-range query parameters are rejected."""
+        response = test_client.get(f"/api/reviews?{query}")
         
         assert response.status_code == 422  # Validation error
 
-    def test_list_reviews_summary_structure(self, test_client: TestClient):
+    def test_list_reviews_summary_structure(self, default_reviews_response):
         """Test that summary has correct structure."""
-        response = test_client.get("/api/reviews")
-        
-        assert response.status_code == 200
-        data = response.json()
+        status_code, data = default_reviews_response
+
+        assert status_code == 200
         summary = data["summary"]
         
         assert "total_reviews" in summary
@@ -107,12 +133,11 @@ class TestReviewsList:
         assert "neutral" in sentiment
         assert "negative" in sentiment
 
-    def test_list_reviews_review_structure(self, test_client: TestClient):
+    def test_list_reviews_review_structure(self, default_reviews_response):
         """Test that reviews have correct structure."""
-        response = test_client.get("/api/reviews")
-        
-        assert response.status_code == 200
-        data = response.json()
+        status_code, data = default_reviews_response
+
+        assert status_code == 200
         reviews = data["reviews"]
         
         if len(reviews) > 0:
@@ -121,16 +146,51 @@ class TestReviewsList:
             assert "authorName" in review
             assert "comments" in review
 
+    def test_list_reviews_rendered_off_event_loop(self, test_client: TestClient):
+        """Test that the response body is validated and serialized in the threadpool."""
+        from app.api import routes
+
+        render = routes._render_reviews_response
+        loops = []
+
+        def recording_render(*args):
+            try:
+                loops.append(asyncio.get_running_loop())
+            except RuntimeError:
+                loops.append(None)
+            return render(*args)
+
+        with patch.object(routes, "_render_reviews_response", recording_render):
+            response = test_client.get("/api/reviews")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert loops == [None]
+
+
+@pytest.mark.integration
+class TestClientDependency:
+    """Tests for the shared Google Play client dependency."""
+
+    def test_client_reused_across_requests(self, test_client: TestClient):
+        """Test that consecutive requests share one client instance."""
+        test_client.get("/api/reviews")
+        first = test_client.app.state.review_client
+
+        test_client.get("/api/reviews/non-existent-review-id")
+
+        assert test_client.app.state.review_client is first
+
 
 @pytest.mark.integration
 class TestGetSingleReview:
     """Tests for get single review endpoint."""
 
-    def test_get_review(self, test_client: TestClient):
+    def test_get_review(self, test_client: TestClient, default_reviews_response):
         """Test getting a single review."""
-        # First get list to find a review ID
-        list_response = test_client.get("/api/reviews")
-        reviews = list_response.json()["reviews"]
+        # Use the listed reviews to find a review ID
+        _, list_data = default_reviews_response
+        reviews = list_data["reviews"]
         
         if len(reviews) > 0:
             review_id = reviews[0]["reviewId"]
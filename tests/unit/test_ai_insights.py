@@ -1,39 +1,48 @@
 """Unit tests for AI insights module."""
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
+from unittest.mock import patch
 
 import pytest
 
 from app.ai.insights import (
     _bucket_sentiment,
+    _compile_filter,
     _extract_keywords,
+    _get_openai_client,
+    filter_and_summarize,
+    maybe_ai_brief,
     summarize_reviews,
 )
-from app.schemas import ReviewFilters
+from app.schemas import Comment, Review, ReviewCompact, ReviewFilters, Timestamp
 
 
 @pytest.mark.unit
 class TestSentimentBucketing:
     """Tests for sentiment bucketing."""
 
-    def test_positive_sentiment(self):
-        """Test positive sentiment detection."""
-        assert _bucket_sentiment(5) == "positive"
-        assert _bucket_sentiment(4) == "positive"
+    @pytest.mark.parametrize(
+        "rating,expected",
+        [
+            (5, "positive"),
+            (4, "positive"),
+            (1, "negative"),
+            (2, "negative"),
+            (3, "neutral"),
+            (None, "neutral"),
+        ],
+    )
+    def test_bucket_sentiment(self, rating, expected):
+        """Test sentiment bucketing for each star rating."""
+        assert _bucket_sentiment(rating) == expected
 
-    def test_negative_sentiment(self):
-        """Test negative sentiment detection."""
-        assert _bucket_sentiment(1) == "negative"
-        assert _bucket_sentiment(2) == "negative"
-
-    def test_neutral_sentiment(self):
-        """Test neutral sentiment detection."""
-        assert _bucket_sentiment(3) == "neutral"
-
-    def test_none_sentiment(self):
-        """Test None rating."""
-        assert _bucket_sentiment(None) == "neutral"
+    def test_out_of_range_sentiment(self):
+        """Test ratings outside the 1-5 star range."""
+        assert _bucket_sentiment(0) == "negative"
+        assert _bucket_sentiment(-1) == "negative"
+        assert _bucket_sentiment(7) == "positive"
 
 
 @pytest.mark.unit
@@ -70,6 +79,12 @@ class TestKeywordExtraction:
         # All words are 3 chars or less, should be filtered
         assert len(keywords) == 0
 
+    def test_extract_keywords_splits_on_unicode_punctuation(self):
+        """Test that curly quotes, ellipses, dashes and emoji separate words."""
+        assert _extract_keywords("It’s great… doesn’t crash") == ("great", "doesn", "crash")
+        assert _extract_keywords("Love❤️ this update—works") == ("love", "update", "works")
+        assert _extract_keywords("«Très» bien, c’était") == ("très", "bien", "était")
+
     def test_extract_keywords_empty_text(self):
         """Test keyword extraction with empty text."""
         keywords = list(_extract_keywords(""))
@@ -99,12 +114,24 @@ class TestKeywordExtraction:
         assert "excellent" in keywords
         assert "GREAT" not in keywords
 
+    def test_extract_keywords_cached(self):
+        """Test that repeated texts are served from the tokenizer cache."""
+        _extract_keywords.cache_clear()
+        text = "Great app with amazing features"
+
+        first = _extract_keywords(text)
+        second = _extract_keywords(text)
+
+        assert second is first
+        assert isinstance(first, tuple)
+        assert _extract_keywords.cache_info().hits == 1
+
 
 @pytest.mark.unit
 class TestSummarizeReviews:
     """Tests for review summarization."""
 
-    def test_summarize_reviews_basic(self, mock_reviews_list, test_settings):
+    def test_summarize_reviews_basic(self, mock_reviews_list):
         """Test basic review summarization."""
         filters = ReviewFilters(
             package_name="com.test.app",
@@ -112,7 +139,7 @@ class TestSummarizeReviews:
             recent_activity_window_hours=72,
         )
         
-        summary = summarize_reviews(mock_reviews_list, filters, test_settings)
+        summary = summarize_reviews(mock_reviews_list, filters)
         
         assert summary.total_reviews == 3
         assert summary.average_rating > 0
@@ -121,10 +148,8 @@ class TestSummarizeReviews:
         assert summary.sentiment.neutral > 0
         assert len(summary.top_keywords) > 0
 
-    def test_summarize_reviews_all_positive(self, mock_user_comment, test_settings):
+    def test_summarize_reviews_all_positive(self, mock_user_comment):
         """Test summarization with all positive reviews."""
-        from app.schemas import Comment, Review
-        
         reviews = [
             Review(
                 reviewId=f"review-{i}",
@@ -140,7 +165,7 @@ class TestSummarizeReviews:
             recent_activity_window_hours=72,
         )
         
-        summary = summarize_reviews(reviews, filters, test_settings)
+        summary = summarize_reviews(reviews, filters)
         
         assert summary.total_reviews == 5
         assert summary.average_rating == 5.0
@@ -148,7 +173,7 @@ class TestSummarizeReviews:
         assert summary.sentiment.negative == 0
         assert summary.sentiment.neutral == 0
 
-    def test_summarize_empty_reviews(self, test_settings):
+    def test_summarize_empty_reviews(self):
         """Test summarization with no reviews."""
         filters = ReviewFilters(
             package_name="com.test.app",
@@ -156,7 +181,7 @@ class TestSummarizeReviews:
             recent_activity_window_hours=72,
         )
         
-        summary = summarize_reviews([], filters, test_settings)
+        summary = summarize_reviews([], filters)
         
         assert summary.total_reviews == 0
         assert summary.average_rating == 0.0
@@ -164,7 +189,7 @@ class TestSummarizeReviews:
         assert summary.sentiment.negative == 0
         assert summary.sentiment.neutral == 0
 
-    def test_summarize_recent_reviews(self, mock_reviews_list, test_settings):
+    def test_summarize_recent_reviews(self, mock_reviews_list):
         """Test counting recent reviews."""
         filters = ReviewFilters(
             package_name="com.test.app",
@@ -172,12 +197,31 @@ class TestSummarizeReviews:
             recent_activity_window_hours=72,
         )
         
-        summary = summarize_reviews(mock_reviews_list, filters, test_settings)
+        summary = summarize_reviews(mock_reviews_list, filters)
         
         # Recent reviews count should be calculated based on window
         assert summary.recent_activity_window_hours == 72
 
-    def test_summarize_keyword_extraction(self, mock_reviews_list, test_settings):
+    def test_summarize_recent_reviews_window(self, mock_user_comment):
+        """Test that only reviews inside the activity window count as recent."""
+        now = datetime.now(timezone.utc)
+        fresh = mock_user_comment.model_copy(
+            update={"lastModified": Timestamp(seconds=str(int(now.timestamp()) - 3600))}
+        )
+        reviews = [
+            Review(reviewId="fresh", comments=[Comment(userComment=fresh)]),
+            Review(reviewId="stale", comments=[Comment(userComment=mock_user_comment)]),
+        ]
+        filters = ReviewFilters(
+            package_name="com.test.app",
+            recent_activity_window_hours=2,
+        )
+
+        summary = summarize_reviews(reviews, filters)
+
+        assert summary.recent_reviews == 1
+
+    def test_summarize_keyword_extraction(self, mock_reviews_list):
         """Test that keywords are extracted correctly."""
         filters = ReviewFilters(
             package_name="com.test.app",
@@ -185,7 +229,7 @@ class TestSummarizeReviews:
             recent_activity_window_hours=72,
         )
         
-        summary = summarize_reviews(mock_reviews_list, filters, test_settings)
+        summary = summarize_reviews(mock_reviews_list, filters)
         
         # Should have at least some keywords
         assert len(summary.top_keywords) > 0
@@ -194,10 +238,30 @@ class TestSummarizeReviews:
         # Keywords should be non-empty
         assert all(len(kw) > 0 for kw in summary.top_keywords)
 
-    def test_summarize_reviews_without_comments(self, test_settings):
+    def test_summarize_counts_keyword_tokens(self, mock_reviews_list):
+        """Test that the running keyword token total matches the extracted tokens."""
+        filters = ReviewFilters(package_name="com.test.app")
+
+        summary = summarize_reviews(mock_reviews_list, filters)
+
+        expected = sum(
+            len(_extract_keywords(review.latest_user_comment.text)) for review in mock_reviews_list
+        )
+        assert summary.total_keyword_tokens == expected
+        assert summary.total_keyword_tokens > 0
+
+    def test_summarize_skips_keywords_when_disabled(self, mock_reviews_list):
+        """Test that keyword extraction is skipped when not requested."""
+        filters = ReviewFilters(package_name="com.test.app", include_keywords=False)
+
+        summary = summarize_reviews(mock_reviews_list, filters)
+
+        assert summary.top_keywords == []
+        assert summary.total_keyword_tokens == 0
+        assert summary.total_reviews == 3
+
+    def test_summarize_reviews_without_comments(self):
         """Test summarization with reviews that have no user comments."""
-        from app.schemas import Review
-        
         reviews = [
             Review(
                 reviewId="review-no-comment",
@@ -212,7 +276,7 @@ class TestSummarizeReviews:
             recent_activity_window_hours=72,
         )
         
-        summary = summarize_reviews(reviews, filters, test_settings)
+        summary = summarize_reviews(reviews, filters)
         
         assert summary.total_reviews == 1
         assert summary.average_rating == 0.0
@@ -220,3 +284,124 @@ class TestSummarizeReviews:
         assert summary.sentiment.negative == 0
         assert summary.sentiment.neutral == 0
 
+
+@pytest.mark.unit
+class TestFilterAndSummarize:
+    """Tests for the fused filter + summary pass."""
+
+    def test_filter_by_rating(self, mock_reviews_list):
+        """Test that rating filters drop reviews before they are summarized."""
+        filters = ReviewFilters(
+            package_name="com.test.app",
+            min_rating=3,
+        )
+
+        filtered, summary = filter_and_summarize(mock_reviews_list, filters)
+
+        assert [review.reviewId for review in filtered] == ["test-review-123", "test-review-789"]
+        assert summary.total_reviews == 2
+        assert summary.average_rating == 4.0
+        assert summary.sentiment.positive == 1
+        assert summary.sentiment.neutral == 1
+        assert summary.sentiment.negative == 0
+
+    def test_filter_by_date(self, mock_reviews_list):
+        """Test that reviews outside the date range are excluded."""
+        filters = ReviewFilters(
+            package_name="com.test.app",
+            start_date=datetime(2025, 1, 1),
+        )
+
+        filtered, summary = filter_and_summarize(mock_reviews_list, filters)
+
+        assert filtered == []
+        assert summary.total_reviews == 0
+        assert summary.top_keywords == []
+
+    def test_filter_accepts_aware_dates(self, mock_reviews_list):
+        """Test that timezone-aware filter dates compare against review timestamps."""
+        filters = ReviewFilters(
+            package_name="com.test.app",
+            start_date=datetime(2024, 11, 1, tzinfo=timezone.utc),
+            end_date=datetime(2024, 11, 30, tzinfo=timezone.utc),
+        )
+
+        filtered, summary = filter_and_summarize(mock_reviews_list, filters)
+
+        assert len(filtered) == 3
+        assert summary.total_reviews == 3
+
+    def test_date_filter_drops_undated_reviews(self, mock_user_comment):
+        """Test that reviews without a timestamp never match a date range."""
+        undated = mock_user_comment.model_copy(update={"lastModified": None})
+        reviews = [Review(reviewId="undated", comments=[Comment(userComment=undated)])]
+
+        unfiltered, _ = filter_and_summarize(reviews, ReviewFilters(package_name="com.test.app"))
+        dated, _ = filter_and_summarize(
+            reviews,
+            ReviewFilters(package_name="com.test.app", end_date=datetime(2030, 1, 1)),
+        )
+
+        assert len(unfiltered) == 1
+        assert dated == []
+
+    def test_compile_filter_without_active_filters(self):
+        """Test that no predicate is built when every filter is unset."""
+        assert _compile_filter(ReviewFilters(package_name="com.test.app")) is None
+
+    def test_compile_filter_combines_active_filters(self):
+        """Test that the compiled predicate applies every active bound."""
+        matches = _compile_filter(
+            ReviewFilters(
+                package_name="com.test.app",
+                start_date=datetime(2024, 1, 1),
+                min_rating=2,
+                max_rating=4,
+            )
+        )
+
+        dated = ReviewCompact(review_id="r", star_rating=3, text=None, ts=1731600000.0)
+        assert matches(dated)
+        assert not matches(ReviewCompact(review_id="r", star_rating=5, text=None, ts=1731600000.0))
+        assert not matches(ReviewCompact(review_id="r", star_rating=None, text=None, ts=1731600000.0))
+        assert not matches(ReviewCompact(review_id="r", star_rating=3, text=None, ts=None))
+
+    def test_filter_drops_reviews_without_comments(self):
+        """Test that reviews lacking a user comment never pass the filter."""
+        reviews = [Review(reviewId="review-no-comment", authorName="User", comments=[])]
+        filters = ReviewFilters(package_name="com.test.app")
+
+        filtered, summary = filter_and_summarize(reviews, filters)
+
+        assert filtered == []
+        assert summary.total_reviews == 0
+
+
+@pytest.mark.unit
+class TestAIBrief:
+    """Tests for the optional AI brief."""
+
+    def test_ai_brief_disabled_without_provider(self, mock_reviews_list, test_settings):
+        """Test that no brief is produced when no AI provider is configured."""
+        assert asyncio.run(maybe_ai_brief(mock_reviews_list, test_settings)) is None
+
+    def test_ai_brief_unsupported_provider(self, mock_reviews_list, test_settings):
+        """Test that unknown providers are skipped."""
+        settings = test_settings.model_copy(update={"ai_provider": "unknown"})
+        assert asyncio.run(maybe_ai_brief(mock_reviews_list, settings)) is None
+
+    def test_ai_brief_requires_api_key(self, mock_reviews_list, test_settings):
+        """Test that the OpenAI provider is skipped without an API key."""
+        settings = test_settings.model_copy(update={"ai_provider": "openai"})
+        assert asyncio.run(maybe_ai_brief(mock_reviews_list, settings)) is None
+
+    def test_openai_client_is_reused(self):
+        """Test that the OpenAI client is cached per API key."""
+        _get_openai_client.cache_clear()
+        with patch("openai.AsyncOpenAI") as mock_async_openai:
+            first = _get_openai_client("test-key")
+            second = _get_openai_client("test-key")
+
+        assert first is second
+        mock_async_openai.assert_called_once_with(api_key="test-key")
+        _get_openai_client.cache_clear()
@@ -1,12 +1,102 @@
 """Unit tests for Google Play Review Client."""
 from __future__ import annotations
 
-from pathlib import Path
-from unittest.mock import MagicMock, patch
+import json
+import threading
+from typing import Callable, Dict, List
+from unittest.mock import Mock, patch
 
 import pytest
+from googleapiclient.discovery import build
+from googleapiclient.http import HttpMockSequence
+
+from app.config import Settings
 from app.schemas import Review
-from app.services.google_play_client import GooglePlayReviewClient
+from app.services.google_play_client import (
+    GooglePlayReviewClient,
+    _clear_service_cache,
+    _load_mock_reviews,
+)
+
+
+def make_paginated_service(pages: List[Dict]) -> Mock:
+    """Build a service mock whose ``reviews().list`` returns one request per page."""
+    service = Mock(spec_set=["reviews"])
+    reviews_resource = Mock(spec_set=["list", "get", "reply"])
+    reviews_resource.list.side_effect = [
+        Mock(spec_set=["execute"], **{"execute.return_value": page}) for page in pages
+    ]
+    service.reviews.return_value = reviews_resource
+    return service
+
+
+class RecordingHttpMockSequence(HttpMockSequence):
+    """``HttpMockSequence`` that also records the URI of every request it answers."""
+
+    def __init__(self, iterable):
+        super().__init__(iterable)
+        self.uris: List[str] = []
+
+    def request(self, uri, *args, **kwargs):
+        self.uris.append(uri)
+        return super().request(uri, *args, **kwargs)
+
+
+@pytest.fixture
+def google_http_stub() -> Callable[..., RecordingHttpMockSequence]:
+    """Serve canned Google Play API bodies at the HTTP layer.
+
+    The returned function takes response bodies in request order and installs a real
+    androidpublisher service, built from the bundled discovery document, over a
+    recording HTTP mock. The client's request building and ``execute`` path runs
+    unmocked; only credentials and the transport are faked.
+    """
+    with patch("app.services.google_play_client.service_account.Credentials"), \
+         patch("app.services.google_play_client.build") as mock_build, \
+         patch("app.services.google_play_client._authorized_http") as mock_authorized_http:
+
+        def install(*payloads: Dict) -> RecordingHttpMockSequence:
+            http = RecordingHttpMockSequence(
+                [({"status": "200"}, json.dumps(payload)) for payload in payloads]
+            )
+            mock_build.return_value = build(
+                "androidpublisher", "v3", http=http, static_discovery=True
+            )
+            mock_authorized_http.return_value = http
+            return http
+
+        yield install
+
+
+@pytest.fixture(scope="module")
+def fake_service_account(tmp_path_factory) -> str:
+    """Write a throwaway service account key file once per module."""
+    key_file = tmp_path_factory.mktemp("creds") / "key.json"
+    key_file.write_text('{"type": "service_account"}')
+    return str(key_file)
+
+
+@pytest.fixture(scope="module")
+def real_api_settings(fake_service_account) -> Settings:
+    """Non-mock settings shared by the tests that go through the Google API client."""
+    return Settings(
+        enable_mock_mode=False,
+        google_service_account_file=fake_service_account,
+    )
+
+
+@pytest.fixture(scope="module")
+def mock_client(test_settings) -> GooglePlayReviewClient:
+    """Mock-mode client shared by the read-only mock tests in this module."""
+    return GooglePlayReviewClient(test_settings)
+
+
+@pytest.fixture(autouse=True)
+def clear_service_cache():
+    """Reset the process-wide Google service cache around each test."""
+    _clear_service_cache()
+    yield
+    _clear_service_cache()
 
 
 @pytest.mark.unit
@@ -17,13 +107,10 @@ class TestGooglePlayReviewClient:
         """Test client initialization."""
         client = GooglePlayReviewClient(test_settings)
         assert client.settings == test_settings
-        assert client._service is None
-        assert client._mock_reviews is None
 
-    def test_list_reviews_mock_mode(self, test_settings):
+    def test_list_reviews_mock_mode(self, mock_client):
         """Test listing reviews in mock mode."""
-        client = GooglePlayReviewClient(test_settings)
-        reviews = client.list_reviews(
+        reviews = mock_client.list_reviews(
             package_name="com.test.app",
             page_size=10,
         )
@@ -32,10 +119,9 @@ class TestGooglePlayReviewClient:
         assert len(reviews) > 0
         assert all(isinstance(r, Review) for r in reviews)
 
-    def test_get_review_mock_mode(self, test_settings):
+    def test_get_review_mock_mode(self, mock_client):
         """Test getting a single review in mock mode."""
-        client = GooglePlayReviewClient(test_settings)
-        review = client.get_review(
+        review = mock_client.get_review(
             package_name="com.test.app",
             review_id="mock-review-1",
         )
@@ -44,139 +130,245 @@ class TestGooglePlayReviewClient:
         assert review.reviewId == "mock-review-1"
         assert review.authorName is not None
 
-    def test_get_review_not_found_mock_mode(self, test_settings):
+    def test_get_review_not_found_mock_mode(self, mock_client):
         """Test getting a non-existent review in mock mode."""
-        client = GooglePlayReviewClient(test_settings)
-        review = client.get_review(
+        review = mock_client.get_review(
             package_name="com.test.app",
             review_id="non-existent-review",
         )
         
         assert review is None
 
+    def test_mock_reviews_loaded_once(self, test_settings):
+        """Test that mock reviews are parsed once and shared by every client."""
+        _load_mock_reviews.cache_clear()
+
+        first = GooglePlayReviewClient(test_settings).list_reviews("com.test.app", page_size=10)
+        second = GooglePlayReviewClient(test_settings).list_reviews("com.test.app", page_size=10)
+
+        assert first is second
+        assert _load_mock_reviews.cache_info().misses == 1
+
+    def test_mock_reviews_missing_file(self, test_settings, tmp_path):
+        """Test that a missing mock file yields no reviews."""
+        _load_mock_reviews.cache_clear()
+        with patch(
+            "app.services.google_play_client.MOCK_REVIEWS_PATH",
+            tmp_path / "missing.json",
+        ):
+            reviews = GooglePlayReviewClient(test_settings).list_reviews(
+                "com.test.app", page_size=10
+            )
+        _load_mock_reviews.cache_clear()
+
+        assert reviews == []
+
+    def test_list_reviews_real_api(self, google_http_stub, real_api_settings):
+        """Test listing reviews with real API (HTTP layer stubbed)."""
+        http = google_http_stub(
+            {
+                "reviews": [{"reviewId": "goog-review-1", "authorName": "Google User"}],
+                "tokenPagination": {},
+            }
+        )
+        
+        client = GooglePlayReviewClient(real_api_settings)
+        reviews = client.list_reviews(
+            package_name="com.test.app",
+            page_size=10,
+        )
+        
+        assert isinstance(reviews, list)
+        assert len(reviews) > 0
+        assert len(http.uris) == 1
+        assert "/applications/com.test.app/reviews?" in http.uris[0]
+        assert "maxResults=10" in http.uris[0]
+
+    def test_get_review_real_api(self, google_http_stub, real_api_settings):
+        """Test getting a review with real API (HTTP layer stubbed)."""
+        http = google_http_stub({"reviewId": "goog-review-1", "authorName": "Google User"})
+        
+        client = GooglePlayReviewClient(real_api_settings)
+        review = client.get_review(
+            package_name="com.test.app",
+            review_id="goog-review-1",
+        )
+        
+        assert isinstance(review, Review)
+        assert review.reviewId == "goog-review-1"
+        assert len(http.uris) == 1
+        assert "/applications/com.test.app/reviews/goog-review-1?" in http.uris[0]
+
     @patch("app.services.google_play_client.service_account.Credentials")
     @patch("app.services.google_play_client.build")
-    def test_list_reviews_real_api(
+    def test_list_reviews_cached_until_invalidated(
         self,
         mock_build,
         mock_creds,
         mock_google_service,
+        fake_service_account,
     ):
-        """Test listing reviews with real API (mocked)."""
-        from app.config import Settings
-        
+        """Test that repeated list calls are served from the TTL cache."""
         test_settings = Settings(
             enable_mock_mode=False,
-            google_service_account_file="test_key.json",
+            google_service_account_file=fake_service_account,
+            cache_ttl_seconds=300,
         )
-        
         mock_build.return_value = mock_google_service
-        mock_creds.from_service_account_file.return_value = MagicMock()
-        
-        # Create a temporary key file
-        key_file = Path("test_key.json")
-        key_file.write_text('{"type": "service_account"}')
-        
-        try:
-            client = GooglePlayReviewClient(test_settings)
-            reviews = client.list_reviews(
-                package_name="com.test.app",
-                page_size=10,
-            )
-            
-            assert isinstance(reviews, list)
-            assert len(reviews) > 0
-            mock_google_service.reviews().list.assert_called_once()
-        finally:
-            if key_file.exists():
-                key_file.unlink()
+
+        client = GooglePlayReviewClient(test_settings)
+        first = client.list_reviews(package_name="com.test.app", page_size=10)
+        second = client.list_reviews(package_name="com.test.app", page_size=10)
+
+        assert second is first
+        assert mock_google_service.reviews().list.call_count == 1
+
+        client.list_reviews(package_name="com.test.app", page_size=20)
+        assert mock_google_service.reviews().list.call_count == 2
+
+        client.invalidate_cache()
+        client.list_reviews(package_name="com.test.app", page_size=10)
+        assert mock_google_service.reviews().list.call_count == 3
 
     @patch("app.services.google_play_client.service_account.Credentials")
     @patch("app.services.google_play_client.build")
-    def test_get_review_real_api(
+    def test_list_reviews_cache_disabled(
         self,
         mock_build,
         mock_creds,
         mock_google_service,
+        fake_service_account,
     ):
-        """Test getting a review with real API (mocked)."""
-        from app.config import Settings
-        
+        """Test that a zero TTL disables result caching."""
         test_settings = Settings(
             enable_mock_mode=False,
-            google_service_account_file="test_key.json",
+            google_service_account_file=fake_service_account,
+            cache_ttl_seconds=0,
         )
-        
         mock_build.return_value = mock_google_service
-        mock_creds.from_service_account_file.return_value = MagicMock()
-        
-        key_file = Path("test_key.json")
-        key_file.write_text('{"type": "service_account"}')
-        
-        try:
-            client = GooglePlayReviewClient(test_settings)
-            review = client.get_review(
-                package_name="com.test.app",
-                review_id="goog-review-1",
-            )
-            
-            assert isinstance(review, Review)
-            assert review.reviewId == "goog-review-1"
-            mock_google_service.reviews().get.assert_called_once()
-        finally:
-            if key_file.exists():
-                key_file.unlink()
-
-    def test_pagination_handling(self):
+
+        client = GooglePlayReviewClient(test_settings)
+        client.list_reviews(package_name="com.test.app", page_size=10)
+        client.list_reviews(package_name="com.test.app", page_size=10)
+
+        assert mock_google_service.reviews().list.call_count == 2
+
+    def test_pagination_handling(self, google_http_stub, real_api_settings):
         """Test that pagination is handled correctly."""
-        from app.config import Settings
+        # First page, then the last page
+        http = google_http_stub(
+            {
+                "reviews": [{"reviewId": "review-1", "authorName": "User 1", "comments": []}],
+                "tokenPagination": {"nextPageToken": "token123"},
+            },
+            {
+                "reviews": [{"reviewId": "review-2", "authorName": "User 2", "comments": []}],
+                "tokenPagination": {},
+            },
+        )
         
-        test_settings = Settings(
-            enable_mock_mode=False,
-            google_service_account_file="test_key.json",
+        client = GooglePlayReviewClient(real_api_settings)
+        reviews = client.list_reviews(
+            package_name="com.test.app",
+            page_size=10,
         )
         
+        assert len(reviews) == 2
+        assert reviews[0].reviewId == "review-1"
+        assert reviews[1].reviewId == "review-2"
+        # Verify two pages were requested, the second with the continuation token
+        assert len(http.uris) == 2
+        assert "token=token123" in http.uris[1]
+
+    def test_next_page_prefetched_while_consuming(self, real_api_settings):
+        """Test that the next page request is issued before the current page is consumed."""
+
         with patch("app.services.google_play_client.service_account.Credentials"), \
              patch("app.services.google_play_client.build") as mock_build:
-            
-            # Create mock service with pagination
-            mock_service = MagicMock()
-            mock_reviews_resource = MagicMock()
-            
-            # First page
-            mock_request_1 = MagicMock()
-            mock_request_1.execute.return_value = {
-                "reviews": [{"reviewId": "review-1", "authorName": "User 1", "comments": []}],
-                "tokenPagination": {"nextPageToken": "token123"},
-            }
-            
-            # Second page (last page)
-            mock_request_2 = MagicMock()
-            mock_request_2.execute.return_value = {
-                "reviews": [{"reviewId": "review-2", "authorName": "User 2", "comments": []}],
-                "tokenPagination": {},
-            }
-            
-            mock_reviews_resource.list.side_effect = [mock_request_1, mock_request_2]
-            mock_service.reviews.return_value = mock_reviews_resource
-            mock_build.return_value = mock_service
-            
-            key_file = Path("test_key.json")
-            key_file.write_text('{"type": "service_account"}')
-            
-            try:
-                client = GooglePlayReviewClient(test_settings)
-                reviews = client.list_reviews(
-                    package_name="com.test.app",
-                    page_size=10,
-                )
-                
-                assert len(reviews) == 2
-                assert reviews[0].reviewId == "review-1"
-                assert reviews[1].reviewId == "review-2"
-                # Verify list was called twice for pagination
-                assert mock_reviews_resource.list.call_count == 2
-            finally:
-                if key_file.exists():
-                    key_file.unlink()
+            mock_build.return_value = make_paginated_service([
+                {
+                    "reviews": [{"reviewId": "review-1"}],
+                    "tokenPagination": {"nextPageToken": "token123"},
+                },
+                {
+                    "reviews": [{"reviewId": "review-2"}],
+                    "tokenPagination": {},
+                },
+            ])
+            mock_reviews_resource = mock_build.return_value.reviews.return_value
+
+            client = GooglePlayReviewClient(real_api_settings)
+            pages = client._iterate_review_pages(package_name="com.test.app", page_size=10)
+
+            first_page = next(pages)
+            assert first_page == [{"reviewId": "review-1"}]
+            assert mock_reviews_resource.list.call_count == 2
+            assert list(pages) == [[{"reviewId": "review-2"}]]
+            mock_reviews_resource.list.assert_called_with(
+                packageName="com.test.app",
+                translationLanguage=None,
+                maxResults=10,
+                token="token123",
+            )
+
+    @patch("app.services.google_play_client.service_account.Credentials")
+    @patch("app.services.google_play_client.build")
+    def test_service_shared_across_clients(self, mock_build, mock_creds, real_api_settings):
+        """Test that the Google service is built once per credentials file and scopes."""
+
+        first = GooglePlayReviewClient(real_api_settings)._build_service()
+        second = GooglePlayReviewClient(real_api_settings)._build_service()
+
+        assert first is second
+        mock_build.assert_called_once()
+        mock_creds.from_service_account_file.assert_called_once_with(
+            real_api_settings.google_service_account_file,
+            scopes=real_api_settings.google_play_scopes,
+        )
+
+    @patch("app.services.google_play_client.service_account.Credentials")
+    @patch("app.services.google_play_client.build")
+    def test_service_built_once_across_list_calls(self, mock_build, mock_creds, fake_service_account):
+        """Test that uncached list calls reuse one service even though pages run on workers."""
+        mock_build.return_value = make_paginated_service([
+            {"reviews": [{"reviewId": "review-1"}]},
+            {"reviews": [{"reviewId": "review-2"}]},
+        ])
+        settings = Settings(
+            enable_mock_mode=False,
+            google_service_account_file=fake_service_account,
+            cache_ttl_seconds=0,
+        )
+        client = GooglePlayReviewClient(settings)
+
+        assert [r.reviewId for r in client.list_reviews("com.test.app", 10)] == ["review-1"]
+        assert [r.reviewId for r in client.list_reviews("com.test.app", 10)] == ["review-2"]
+        mock_build.assert_called_once()
+        mock_creds.from_service_account_file.assert_called_once()
+
+    @patch("app.services.google_play_client.service_account.Credentials")
+    @patch("app.services.google_play_client.build")
+    def test_transport_is_per_thread(self, mock_build, mock_creds, real_api_settings):
+        """Test that threads share the service but execute over their own transport."""
+        client = GooglePlayReviewClient(real_api_settings)
+        request = Mock(spec_set=["execute"])
+        transports = []
+        request.execute.side_effect = lambda http: transports.append(http) or {}
+
+        worker = threading.Thread(target=client._execute, args=(request,))
+        worker.start()
+        worker.join()
+        client._execute(request)
+        client._execute(request)
+
+        assert transports[0] is not transports[1]
+        assert transports[1] is transports[2]
+        assert client._build_service() is mock_build.return_value
+        mock_build.assert_called_once()
+
+    def test_build_service_requires_credentials_file(self, test_settings):
+        """Test that an unconfigured service account path raises."""
+        client = GooglePlayReviewClient(test_settings)
 
+        with pytest.raises(RuntimeError):
+            client._build_service()
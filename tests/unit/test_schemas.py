@@ -1,19 +1,24 @@
 """Unit tests for Pydantic schemas."""
 from __future__ import annotations
 
+from dataclasses import FrozenInstanceError
 from datetime import datetime, timezone
+from typing import List
 
 import pytest
 from pydantic import ValidationError
 
 from app.schemas import (
+    REVIEW_LIST_ADAPTER,
     Comment,
     DeveloperComment,
     Review,
+    ReviewCompact,
     ReviewFilters,
     SentimentSplit,
     Timestamp,
     UserComment,
+    get_adapter,
 )
 
 
@@ -24,7 +29,7 @@ class TestTimestamp:
     def test_timestamp_creation(self):
         """Test creating a timestamp."""
         ts = Timestamp(seconds="1731600000", nanos=0)
-        assert ts.seconds == "1731600000"
+        assert ts.seconds == 1731600000
         assert ts.nanos == 0
 
     def test_timestamp_to_datetime(self):
@@ -41,6 +46,26 @@ class TestTimestamp:
         dt = ts.to_datetime()
         assert dt.microsecond == 500000
 
+    def test_timestamp_dt_is_aware_and_memoized(self):
+        """Test the cached timezone-aware datetime."""
+        ts = Timestamp(seconds="1731600000", nanos=0)
+        assert ts.dt == datetime(2024, 11, 14, 16, 0, tzinfo=timezone.utc)
+        assert ts.dt is ts.dt
+        assert ts.to_datetime() == ts.dt.replace(tzinfo=None)
+
+    def test_timestamp_conversion_shared_across_instances(self):
+        """Test that equal timestamps reuse one cached datetime."""
+        first = Timestamp(seconds="1731600000", nanos=250000000)
+        second = Timestamp(seconds="1731600000", nanos=250000000)
+        assert first.dt is second.dt
+        assert first.dt.microsecond == 250000
+
+    def test_timestamp_without_seconds(self):
+        """Test that a missing seconds value yields no datetime."""
+        ts = Timestamp()
+        assert ts.dt is None
+        assert ts.to_datetime() is None
+
 
 @pytest.mark.unit
 class TestUserComment:
@@ -99,6 +124,68 @@ class TestReview:
         assert latest is not None
         assert latest.text == "Thank you for your feedback!"
 
+    def test_latest_comments_are_memoized(self, mock_review):
+        """Test that the latest comment lookups are computed once and not serialized."""
+        assert mock_review.latest_user_comment is mock_review.latest_user_comment
+        assert mock_review.latest_developer_comment is mock_review.latest_developer_comment
+
+        dumped = mock_review.model_dump()
+        assert "latest_user_comment" not in dumped
+        assert "latest_developer_comment" not in dumped
+
+    def test_model_copy_recomputes_memoized_values(self, mock_review):
+        """Test that copies do not inherit memoized values from the original."""
+        assert mock_review.latest_user_comment is not None
+        assert mock_review.compact is not None
+
+        copied = mock_review.model_copy(update={"comments": []})
+        assert copied.latest_user_comment is None
+        assert copied.compact is None
+        assert mock_review.latest_user_comment is not None
+
+        ts = Timestamp(seconds="1731600000", nanos=0)
+        assert ts.dt is not None
+        assert ts.model_copy(update={"seconds": None}).dt is None
+
+    def test_compact_projection(self, mock_review):
+        """Test the slotted projection used by the summary pass."""
+        compact = mock_review.compact
+        assert compact == ReviewCompact(
+            review_id="test-review-123",
+            star_rating=5,
+            text="Great app! Love the new features.",
+            ts=1731600000.0,
+        )
+        assert mock_review.compact is compact
+        assert not hasattr(compact, "__dict__")
+
+    def test_review_is_frozen(self, mock_review):
+        """Test that fetched reviews cannot be reassigned field by field."""
+        with pytest.raises(ValidationError):
+            mock_review.authorName = "Someone Else"
+        with pytest.raises(ValidationError):
+            mock_review.latest_user_comment.starRating = 1
+        with pytest.raises(ValidationError):
+            mock_review.comments[0].userComment = None
+        with pytest.raises(AttributeError):
+            mock_review.comments.append(mock_review.comments[0])
+
+    def test_validated_review_is_hashable(self):
+        """Test that validation stores comments as a tuple, making reviews hashable."""
+        payload = {
+            "reviewId": "hashable",
+            "comments": [
+                {"userComment": {"starRating": 4, "deviceMetadata": {"ramMb": 2048}}},
+            ],
+        }
+        first = Review.model_validate(payload)
+        second = Review.model_validate(payload)
+
+        assert isinstance(first.comments, tuple)
+        assert hash(first) == hash(second)
+        with pytest.raises(ValidationError):
+            first.latest_user_comment.deviceMetadata.ramMb = 1
+
     def test_review_without_user_comment(self):
         """Test review with no user comments."""
         review = Review(
@@ -108,6 +195,46 @@ class TestReview:
         )
         assert review.latest_user_comment is None
         assert review.latest_developer_comment is None
+        assert review.compact is None
+
+
+@pytest.mark.unit
+class TestReviewListAdapter:
+    """Tests for the shared list-of-reviews validator."""
+
+    def test_validate_payload(self):
+        """Test validating a raw API page in one call."""
+        reviews = REVIEW_LIST_ADAPTER.validate_python(
+            [
+                {
+                    "reviewId": "review-1",
+                    "comments": [
+                        {
+                            "userComment": {
+                                "text": "Works well",
+                                "lastModified": {"seconds": "1731600000", "nanos": 0},
+                                "starRating": 4,
+                            }
+                        }
+                    ],
+                },
+                {"reviewId": "review-2"},
+            ]
+        )
+
+        assert [review.reviewId for review in reviews] == ["review-1", "review-2"]
+        assert all(isinstance(review, Review) for review in reviews)
+        assert reviews[0].latest_user_comment.lastModified.seconds == 1731600000
+
+    def test_adapters_are_shared_per_type(self):
+        """Test that get_adapter hands out one adapter per type."""
+        assert get_adapter(List[Review]) is REVIEW_LIST_ADAPTER
+        assert get_adapter(Review) is get_adapter(Review)
+
+    def test_validate_payload_rejects_missing_id(self):
+        """Test that invalid entries still raise a validation error."""
+        with pytest.raises(ValidationError):
+            REVIEW_LIST_ADAPTER.validate_python([{"authorName": "No ID"}])
 
 
 @pytest.mark.unit
@@ -150,6 +277,12 @@ class TestReviewFilters:
         assert filters.min_rating is None
         assert filters.max_rating is None
 
+    def test_filters_are_immutable(self):
+        """Test that filters cannot be mutated after construction."""
+        filters = ReviewFilters(package_name="com.test.app")
+        with pytest.raises(FrozenInstanceError):
+            filters.min_rating = 3
+
 
 @pytest.mark.unit
 class TestSentimentSplit:
@@ -173,3 +306,19 @@ class TestSentimentSplit:
         assert sentiment.neutral == 0
         assert sentiment.negative == 0
 
+    def test_sentiment_in_place_add(self):
+        """Test accumulating sentiment splits in place."""
+        total = SentimentSplit()
+        original = total
+        total += SentimentSplit(positive=2, neutral=1)
+        total += SentimentSplit(negative=3)
+        assert total is original
+        assert total == SentimentSplit(positive=2, neutral=1, negative=3)
+
+    def test_sentiment_sum(self):
+        """Test combining many splits with the builtin sum()."""
+        splits = [SentimentSplit(positive=1), SentimentSplit(neutral=2), SentimentSplit(negative=3)]
+        total = sum(splits, SentimentSplit())
+        assert total == SentimentSplit(positive=1, neutral=2, negative=3)
+        assert splits[0] == SentimentSplit(positive=1)
+